@@ -0,0 +1,60 @@
+"""
+Constants shared by the analyzers.
+
+Everything fixed at startup (tag sets, compiled patterns, thresholds,
+translation tables) is built once here at import time.
+"""
+
+import re
+from app.config import settings
+
+# --- Content quality ---
+
+# Elements excluded from the main content (scripts, styles, nav, footer, etc.)
+EXCLUDED_TAGS = frozenset({'script', 'style', 'nav', 'footer', 'header'})
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Below this many words readability scoring is skipped
+MIN_READABILITY_WORDS = 10
+
+# Flesch Reading Ease lower bounds and the level for each band
+READABILITY_THRESHOLDS = (30, 50, 60, 70, 80, 90)
+READABILITY_LEVELS = (
+    'Very Difficult', 'Difficult', 'Fairly Difficult', 'Standard',
+    'Fairly Easy', 'Easy', 'Very Easy'
+)
+
+# --- Headings ---
+
+HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+
+# Heading tag name -> level
+HEADING_LEVELS = {tag: int(tag[1]) for tag in HEADING_TAGS}
+
+# --- Images ---
+
+# Limits for response size
+MAX_REPORTED_IMAGES = 20
+MAX_MISSING_ALT_EXAMPLES = 5
+
+# --- Meta ---
+
+# Length thresholds bound once at import; settings are static for the process
+TITLE_MIN_LENGTH = settings.TITLE_MIN_LENGTH
+TITLE_MAX_LENGTH = settings.TITLE_MAX_LENGTH
+DESCRIPTION_MIN_LENGTH = settings.DESCRIPTION_MIN_LENGTH
+DESCRIPTION_MAX_LENGTH = settings.DESCRIPTION_MAX_LENGTH
+TITLE_RANGE = f'{TITLE_MIN_LENGTH}-{TITLE_MAX_LENGTH}'
+DESCRIPTION_RANGE = f'{DESCRIPTION_MIN_LENGTH}-{DESCRIPTION_MAX_LENGTH}'
+
+# --- Schema ---
+
+JSON_LD_TYPE = 'application/ld+json'
+RECOMMENDED_SCHEMA_TYPES = ('Organization', 'WebSite', 'WebPage', 'Article', 'Product', 'BreadcrumbList')
+
+# --- URL ---
+
+# Characters allowed in SEO-friendly paths; translate() deletes them so any
+# leftover character is disallowed
+ALLOWED_PATH_CHARS = 'abcdefghijklmnopqrstuvwxyz0123456789-/'
+DELETE_ALLOWED_CHARS = str.maketrans('', '', ALLOWED_PATH_CHARS)
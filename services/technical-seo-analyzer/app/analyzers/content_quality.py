@@ -1,72 +1,116 @@
+import bisect
+import math
+from functools import lru_cache
 import textstat
-from app.utils.fetcher import parse_html
+from bs4 import BeautifulSoup, Tag, NavigableString, CData
+from app.analyzers._constants import (
+    EXCLUDED_TAGS, WHITESPACE_RE, MIN_READABILITY_WORDS,
+    READABILITY_THRESHOLDS, READABILITY_LEVELS
+)
+from app.utils.issue import Issue
 from app.utils.scorer import calculate_score_from_issues
 
+@lru_cache(maxsize=8192)
+def _word_syllables(word: str) -> int:
+    """Count syllables in a single word using textstat's pyphen dictionary"""
+    return len(textstat.pyphen.positions(word)) + 1
+
+def _syllable_count(text: str) -> int:
+    """Same result as textstat.syllable_count, but memoized per distinct word"""
+    words = textstat.remove_punctuation(text.lower()).split()
+    return sum(map(_word_syllables, words))
+
+def _text_counts(text: str) -> tuple:
+    """Count sentences, words and syllables of a text"""
+    return (
+        textstat.sentence_count(text),
+        textstat.lexicon_count(text, removepunct=True),
+        _syllable_count(text)
+    )
+
+def _legacy_round(number: float, points: int) -> float:
+    """Round half away from zero, as textstat does for its scores"""
+    p = 10 ** points
+    return math.floor(number * p + math.copysign(0.5, number)) / p
+
+def _flesch_scores(counts: tuple) -> tuple:
+    """Compute Flesch Reading Ease and Flesch-Kincaid Grade from _text_counts() counts"""
+    sentence_count, word_count, syllable_count = counts
+    
+    # textstat rounds both averages to one decimal before applying the formulas
+    sentence_length = _legacy_round(word_count / sentence_count, 1)
+    syllables_per_word = _legacy_round(syllable_count / word_count, 1) if word_count else 0.0
+    
+    reading_ease = 206.835 - 1.015 * sentence_length - 84.6 * syllables_per_word
+    grade = 0.39 * sentence_length + 11.8 * syllables_per_word - 15.59
+    
+    return _legacy_round(reading_ease, 2), _legacy_round(grade, 1)
+
 class ContentQualityAnalyzer:
     """Analyze content quality (readability, word count, etc.)"""
     
-    def __init__(self, html_content: str):
-        self.soup = parse_html(html_content)
+    __slots__ = ('soup', 'issues')
+    
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
         self.issues = []
     
     def analyze(self) -> dict:
         """Run full content quality analysis"""
-        # Extract main content (remove scripts, styles, nav, footer, etc.)
-        for element in self.soup(['script', 'style', 'nav', 'footer', 'header']):
-            element.decompose()
+        # Get text content and paragraph count (the soup is shared, so skip
+        # excluded elements instead of decomposing them)
+        text, paragraph_count = self._collect_content()
         
-        # Get text content
-        text = self.soup.get_text()
-        
-        # Clean text
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
+        # Clean text (collapse all whitespace runs to single spaces)
+        text = WHITESPACE_RE.sub(' ', text).strip()
         
         # Analyze
         word_count = len(text.split())
         char_count = len(text)
-        sentence_count = textstat.sentence_count(text)
+        
+        # Fast path: too little text for meaningful readability scores
+        # (JS-only shells and empty pages are common in bulk crawls)
+        if word_count < MIN_READABILITY_WORDS:
+            return self._insufficient_content_result(text, word_count, char_count, paragraph_count)
+        
+        # Counted once, shared by sentence_count and the readability scores
+        counts = _text_counts(text)
+        sentence_count = counts[0]
         
         # Readability scores
-        flesch_reading_ease = textstat.flesch_reading_ease(text) if word_count > 0 else 0
-        flesch_kincaid_grade = textstat.flesch_kincaid_grade(text) if word_count > 0 else 0
+        flesch_reading_ease, flesch_kincaid_grade = _flesch_scores(counts)
         
         # Check word count
         if word_count < 300:
-            self.issues.append({
-                'type': 'warning',
-                'category': 'content',
-                'message': f'Low word count: {word_count} words',
-                'recommendation': 'Add more content (recommended: 300+ words)',
-                'impact': 'medium'
-            })
+            self.issues.append(Issue(
+                type='warning',
+                category='content',
+                message=f'Low word count: {word_count} words',
+                recommendation='Add more content (recommended: 300+ words)',
+                impact='medium'
+            ))
         
         # Check readability
         if flesch_reading_ease < 30:
-            self.issues.append({
-                'type': 'warning',
-                'category': 'content',
-                'message': 'Content is difficult to read',
-                'recommendation': 'Simplify language for better readability',
-                'impact': 'low'
-            })
-        
-        # Calculate paragraph count
-        paragraphs = self.soup.find_all('p')
-        paragraph_count = len(paragraphs)
+            self.issues.append(Issue(
+                type='warning',
+                category='content',
+                message='Content is difficult to read',
+                recommendation='Simplify language for better readability',
+                impact='low'
+            ))
         
         # Calculate average paragraph length
         avg_paragraph_length = word_count / paragraph_count if paragraph_count > 0 else 0
         
         if avg_paragraph_length > 150:
-            self.issues.append({
-                'type': 'info',
-                'category': 'content',
-                'message': 'Long paragraphs detected',
-                'recommendation': 'Break up long paragraphs for better readability',
-                'impact': 'low'
-            })
+            self.issues.append(Issue(
+                type='info',
+                category='content',
+                message='Long paragraphs detected',
+                recommendation='Break up long paragraphs for better readability',
+                impact='low'
+            ))
         
         score = calculate_score_from_issues(self.issues)
         
@@ -83,19 +127,57 @@ class ContentQualityAnalyzer:
             'issues': self.issues
         }
     
-    def _get_readability_level(self, score: float) -> str:
+    def _insufficient_content_result(self, text: str, word_count: int, char_count: int, paragraph_count: int) -> dict:
+        """Build the result for pages with too few words to score readability"""
+        self.issues.append(Issue(
+            type='warning',
+            category='content',
+            message=f'Insufficient content: {word_count} words',
+            recommendation='Add more content (recommended: 300+ words)',
+            impact='high'
+        ))
+        
+        avg_paragraph_length = word_count / paragraph_count if paragraph_count > 0 else 0
+        
+        return {
+            'score': calculate_score_from_issues(self.issues),
+            'word_count': word_count,
+            'character_count': char_count,
+            # Sentences only: no word tokenizing or syllable counting for unscored pages
+            'sentence_count': textstat.sentence_count(text) if word_count > 0 else 0,
+            'paragraph_count': paragraph_count,
+            'avg_paragraph_length': round(avg_paragraph_length, 1),
+            'flesch_reading_ease': 0,
+            'flesch_kincaid_grade': 0,
+            # Not scored: a Flesch score of 0 would read as "Very Difficult"
+            'readability_level': 'N/A',
+            'issues': self.issues
+        }
+    
+    def _collect_content(self) -> tuple:
+        """Collect visible text and <p> count in one walk, skipping excluded elements"""
+        texts = []
+        paragraph_count = 0
+        stack = [iter(self.soup.children)]
+        
+        while stack:
+            for node in stack[-1]:
+                if isinstance(node, Tag):
+                    if node.name in EXCLUDED_TAGS:
+                        continue
+                    if node.name == 'p':
+                        paragraph_count += 1
+                    stack.append(iter(node.children))
+                    break
+                # Same string types as get_text() (no comments, doctypes, etc.)
+                if type(node) in (NavigableString, CData):
+                    texts.append(node)
+            else:
+                stack.pop()
+        
+        return ''.join(texts), paragraph_count
+    
+    @staticmethod
+    def _get_readability_level(score: float) -> str:
         """Convert Flesch Reading Ease score to readability level"""
-        if score >= 90:
-            return 'Very Easy'
-        elif score >= 80:
-            return 'Easy'
-        elif score >= 70:
-            return 'Fairly Easy'
-        elif score >= 60:
-            return 'Standard'
-        elif score >= 50:
-            return 'Fairly Difficult'
-        elif score >= 30:
-            return 'Difficult'
-        else:
-            return 'Very Difficult'
+        return READABILITY_LEVELS[bisect.bisect_right(READABILITY_THRESHOLDS, score)]
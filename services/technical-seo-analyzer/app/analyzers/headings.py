@@ -1,55 +1,69 @@
-from app.utils.fetcher import parse_html, sanitize_text
+from bs4 import BeautifulSoup, Tag
+from app.analyzers._constants import HEADING_LEVELS
+from app.utils.fetcher import sanitize_text
+from app.utils.issue import Issue
 from app.utils.scorer import calculate_score_from_issues
 
 class HeadingAnalyzer:
     """Analyze heading structure (H1-H6)"""
     
-    def __init__(self, html_content: str):
-        self.soup = parse_html(html_content)
+    __slots__ = ('soup', 'issues')
+    
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
         self.issues = []
     
     def analyze(self) -> dict:
         """Run full heading analysis"""
-        # Extract all headings
-        h1 = [sanitize_text(h.get_text().strip()) for h in self.soup.find_all('h1')]
-        h2 = [sanitize_text(h.get_text().strip()) for h in self.soup.find_all('h2')]
-        h3 = [sanitize_text(h.get_text().strip()) for h in self.soup.find_all('h3')]
-        h4 = [sanitize_text(h.get_text().strip()) for h in self.soup.find_all('h4')]
-        h5 = [sanitize_text(h.get_text().strip()) for h in self.soup.find_all('h5')]
-        h6 = [sanitize_text(h.get_text().strip()) for h in self.soup.find_all('h6')]
+        # Extract all headings in a single traversal, grouped by level
+        headings = self._collect_headings()
         
         # Build hierarchy
-        hierarchy = self._build_hierarchy()
+        hierarchy = self._build_hierarchy(headings)
         
         # Check for issues
-        self._check_h1_count(len(h1))
-        self._check_empty_headings()
+        self._check_h1_count(len(headings[1]))
+        self._check_empty_headings(headings)
         structure_valid = self._validate_hierarchy(hierarchy)
         
         score = calculate_score_from_issues(self.issues)
         
         return {
             'score': score,
-            'h1': h1,
-            'h2': h2,
-            'h3': h3,
-            'h4': h4,
-            'h5': h5,
-            'h6': h6,
+            'h1': headings[1],
+            'h2': headings[2],
+            'h3': headings[3],
+            'h4': headings[4],
+            'h5': headings[5],
+            'h6': headings[6],
             'structure_valid': structure_valid,
             'hierarchy': hierarchy,
             'issues': self.issues
         }
     
-    def _build_hierarchy(self) -> list:
+    def _collect_headings(self) -> dict:
+        """Collect sanitized heading texts by level (1-6) in one pass"""
+        headings = {level: [] for level in range(1, 7)}
+        
+        # Plain descendant walk: find_all with a list of names matches every
+        # element through bs4's strainer machinery, which is far slower
+        for node in self.soup.descendants:
+            if isinstance(node, Tag):
+                level = HEADING_LEVELS.get(node.name)
+                if level:
+                    headings[level].append(sanitize_text(node.get_text().strip()))
+        
+        return headings
+    
+    def _build_hierarchy(self, headings: dict) -> list:
         """Build heading hierarchy with positions"""
         hierarchy = []
         
-        for i in range(1, 7):
-            for idx, heading in enumerate(self.soup.find_all(f'h{i}')):
+        for level in range(1, 7):
+            for text in headings[level]:
                 hierarchy.append({
-                    'level': i,
-                    'text': sanitize_text(heading.get_text().strip()),
+                    'level': level,
+                    'text': text,
                     'position': len(hierarchy)
                 })
         
@@ -58,34 +72,34 @@ class HeadingAnalyzer:
     def _check_h1_count(self, count: int):
         """Check H1 count"""
         if count == 0:
-            self.issues.append({
-                'type': 'error',
-                'category': 'headings',
-                'message': 'Missing H1 tag',
-                'recommendation': 'Add exactly one H1 tag that describes the main topic',
-                'impact': 'high'
-            })
+            self.issues.append(Issue(
+                type='error',
+                category='headings',
+                message='Missing H1 tag',
+                recommendation='Add exactly one H1 tag that describes the main topic',
+                impact='high'
+            ))
         elif count > 1:
-            self.issues.append({
-                'type': 'warning',
-                'category': 'headings',
-                'message': f'Multiple H1 tags found ({count})',
-                'recommendation': 'Use only one H1 tag per page',
-                'impact': 'medium'
-            })
+            self.issues.append(Issue(
+                type='warning',
+                category='headings',
+                message=f'Multiple H1 tags found ({count})',
+                recommendation='Use only one H1 tag per page',
+                impact='medium'
+            ))
     
-    def _check_empty_headings(self):
+    def _check_empty_headings(self, headings: dict):
         """Check for empty headings"""
-        for i in range(1, 7):
-            for heading in self.soup.find_all(f'h{i}'):
-                if not heading.get_text().strip():
-                    self.issues.append({
-                        'type': 'warning',
-                        'category': 'headings',
-                        'message': f'Empty H{i} tag found',
-                        'recommendation': 'Remove empty heading or add descriptive text',
-                        'impact': 'low'
-                    })
+        for level in range(1, 7):
+            for text in headings[level]:
+                if not text:
+                    self.issues.append(Issue(
+                        type='warning',
+                        category='headings',
+                        message=f'Empty H{level} tag found',
+                        recommendation='Remove empty heading or add descriptive text',
+                        impact='low'
+                    ))
     
     def _validate_hierarchy(self, hierarchy: list) -> bool:
         """Validate heading hierarchy (no skipped levels)"""
@@ -98,13 +112,13 @@ class HeadingAnalyzer:
             
             # Check if we skipped a level
             if level > prev_level + 1:
-                self.issues.append({
-                    'type': 'warning',
-                    'category': 'headings',
-                    'message': f'Skipped heading level: H{prev_level} to H{level}',
-                    'recommendation': f'Use proper heading hierarchy (H{prev_level + 1} before H{level})',
-                    'impact': 'low'
-                })
+                self.issues.append(Issue(
+                    type='warning',
+                    category='headings',
+                    message=f'Skipped heading level: H{prev_level} to H{level}',
+                    recommendation=f'Use proper heading hierarchy (H{prev_level + 1} before H{level})',
+                    impact='low'
+                ))
                 return False
             
             prev_level = level
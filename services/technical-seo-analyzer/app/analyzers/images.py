@@ -1,11 +1,15 @@
-from app.utils.fetcher import parse_html
+from bs4 import BeautifulSoup
+from app.analyzers._constants import MAX_REPORTED_IMAGES, MAX_MISSING_ALT_EXAMPLES
+from app.utils.issue import Issue
 from app.utils.scorer import calculate_score_from_issues
 
 class ImageAnalyzer:
     """Analyze images (alt text, dimensions, etc.)"""
     
-    def __init__(self, html_content: str):
-        self.soup = parse_html(html_content)
+    __slots__ = ('soup', 'issues')
+    
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
         self.issues = []
     
     def analyze(self) -> dict:
@@ -18,21 +22,21 @@ class ImageAnalyzer:
         empty_alt = 0
         
         image_data = []
+        missing_alt_srcs = []
         
         for img in images:
-            alt = img.get('alt')
-            src = img.get('src', '')
-            
-            img_info = {
-                'src': src,
-                'alt': alt,
-                'has_alt': alt is not None,
-                'alt_empty': alt == '',
-                'width': img.get('width'),
-                'height': img.get('height')
-            }
+            src, alt, width, height = img.get('src', ''), img.get('alt'), img.get('width'), img.get('height')
             
-            image_data.append(img_info)
+            # Only the first images are reported, so skip building the rest
+            if len(image_data) < MAX_REPORTED_IMAGES:
+                image_data.append({
+                    'src': src,
+                    'alt': alt,
+                    'has_alt': alt is not None,
+                    'alt_empty': alt == '',
+                    'width': width,
+                    'height': height
+                })
             
             if alt is not None:
                 images_with_alt += 1
@@ -40,13 +44,21 @@ class ImageAnalyzer:
                     empty_alt += 1
             else:
                 images_without_alt += 1
-                self.issues.append({
-                    'type': 'warning',
-                    'category': 'images',
-                    'message': f'Image missing alt text: {src[:50]}...',
-                    'recommendation': 'Add descriptive alt text for accessibility and SEO',
-                    'impact': 'medium'
-                })
+                if len(missing_alt_srcs) < MAX_MISSING_ALT_EXAMPLES:
+                    missing_alt_srcs.append(src)
+        
+        # One aggregated issue instead of one per image; count keeps the
+        # per-image penalty when scoring
+        if images_without_alt > 0:
+            self.issues.append(Issue(
+                type='warning',
+                category='images',
+                message=f'{images_without_alt} image{"s" if images_without_alt != 1 else ""} missing alt text',
+                recommendation='Add descriptive alt text for accessibility and SEO',
+                impact='medium',
+                examples=tuple(missing_alt_srcs),
+                count=images_without_alt
+            ))
         
         # Calculate coverage
         alt_coverage = (images_with_alt / total_images * 100) if total_images > 0 else 100
@@ -60,6 +72,6 @@ class ImageAnalyzer:
             'images_without_alt': images_without_alt,
             'empty_alt': empty_alt,
             'alt_coverage': round(alt_coverage, 1),
-            'images': image_data[:20],  # Limit to first 20 for response size
+            'images': image_data,  # Limited to the first images for response size
             'issues': self.issues
         }
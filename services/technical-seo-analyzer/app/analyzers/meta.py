@@ -1,18 +1,26 @@
 from bs4 import BeautifulSoup
-from app.config import settings
-from app.utils.fetcher import parse_html, sanitize_text
+from app.analyzers._constants import (
+    TITLE_MIN_LENGTH, TITLE_MAX_LENGTH, DESCRIPTION_MIN_LENGTH, DESCRIPTION_MAX_LENGTH,
+    TITLE_RANGE, DESCRIPTION_RANGE
+)
+from app.utils.fetcher import sanitize_text
+from app.utils.issue import Issue
 from app.utils.scorer import calculate_score_from_issues
 
 class MetaAnalyzer:
     """Analyze meta tags (title, description, OG tags, etc.)"""
     
-    def __init__(self, url: str, html_content: str):
+    __slots__ = ('url', 'soup', 'issues', 'meta_by_name', 'meta_by_property', 'meta_by_http_equiv', 'charset_meta')
+    
+    def __init__(self, url: str, soup: BeautifulSoup):
         self.url = url
-        self.soup = parse_html(html_content)
+        self.soup = soup
         self.issues = []
     
     def analyze(self) -> dict:
         """Run full meta analysis"""
+        self._index_meta_tags()
+        
         title_data = self._analyze_title()
         description_data = self._analyze_description()
         canonical_data = self._analyze_canonical()
@@ -39,18 +47,46 @@ class MetaAnalyzer:
             'issues': self.issues
         }
     
+    def _index_meta_tags(self):
+        """Bucket all meta tags by name/property/http-equiv in a single pass"""
+        self.meta_by_name = {}
+        self.meta_by_property = {}
+        self.meta_by_http_equiv = {}
+        self.charset_meta = None
+        
+        for tag in self.soup.find_all('meta'):
+            name = tag.get('name')
+            if name is not None:
+                self.meta_by_name.setdefault(name, []).append(tag)
+            
+            prop = tag.get('property')
+            if prop is not None:
+                self.meta_by_property.setdefault(prop, []).append(tag)
+            
+            http_equiv = tag.get('http-equiv')
+            if http_equiv is not None:
+                self.meta_by_http_equiv.setdefault(http_equiv, []).append(tag)
+            
+            if self.charset_meta is None and tag.get('charset') is not None:
+                self.charset_meta = tag
+    
+    def _first_meta(self, bucket: dict, key: str):
+        """Return the first meta tag indexed under key, or None"""
+        tags = bucket.get(key)
+        return tags[0] if tags else None
+    
     def _analyze_title(self) -> dict:
         """Analyze title tag"""
         title_tag = self.soup.find('title')
         
         if not title_tag:
-            self.issues.append({
-                'type': 'error',
-                'category': 'meta',
-                'message': 'Missing title tag',
-                'recommendation': 'Add a descriptive title tag (50-60 characters)',
-                'impact': 'high'
-            })
+            self.issues.append(Issue(
+                type='error',
+                category='meta',
+                message='Missing title tag',
+                recommendation='Add a descriptive title tag (50-60 characters)',
+                impact='high'
+            ))
             return {
                 'value': None,
                 'length': 0,
@@ -64,38 +100,38 @@ class MetaAnalyzer:
         issues = []
         
         # Check length
-        if title_length < settings.TITLE_MIN_LENGTH:
+        if title_length < TITLE_MIN_LENGTH:
             status = 'warning'
-            issues.append(f'Title too short ({title_length} chars, recommended: {settings.TITLE_MIN_LENGTH}-{settings.TITLE_MAX_LENGTH})')
-            self.issues.append({
-                'type': 'warning',
-                'category': 'meta',
-                'message': f'Title too short: {title_length} characters',
-                'recommendation': f'Expand title to {settings.TITLE_MIN_LENGTH}-{settings.TITLE_MAX_LENGTH} characters',
-                'impact': 'medium'
-            })
-        elif title_length > settings.TITLE_MAX_LENGTH:
+            issues.append(f'Title too short ({title_length} chars, recommended: {TITLE_RANGE})')
+            self.issues.append(Issue(
+                type='warning',
+                category='meta',
+                message=f'Title too short: {title_length} characters',
+                recommendation=f'Expand title to {TITLE_RANGE} characters',
+                impact='medium'
+            ))
+        elif title_length > TITLE_MAX_LENGTH:
             status = 'warning'
-            issues.append(f'Title too long ({title_length} chars, recommended: {settings.TITLE_MIN_LENGTH}-{settings.TITLE_MAX_LENGTH})')
-            self.issues.append({
-                'type': 'warning',
-                'category': 'meta',
-                'message': f'Title too long: {title_length} characters',
-                'recommendation': f'Shorten title to {settings.TITLE_MIN_LENGTH}-{settings.TITLE_MAX_LENGTH} characters',
-                'impact': 'medium'
-            })
+            issues.append(f'Title too long ({title_length} chars, recommended: {TITLE_RANGE})')
+            self.issues.append(Issue(
+                type='warning',
+                category='meta',
+                message=f'Title too long: {title_length} characters',
+                recommendation=f'Shorten title to {TITLE_RANGE} characters',
+                impact='medium'
+            ))
         
         # Check if empty
         if not title_text:
             status = 'error'
             issues.append('Title tag is empty')
-            self.issues.append({
-                'type': 'error',
-                'category': 'meta',
-                'message': 'Title tag is empty',
-                'recommendation': 'Add descriptive title text',
-                'impact': 'high'
-            })
+            self.issues.append(Issue(
+                type='error',
+                category='meta',
+                message='Title tag is empty',
+                recommendation='Add descriptive title text',
+                impact='high'
+            ))
         
         return {
             'value': title_text,
@@ -106,16 +142,16 @@ class MetaAnalyzer:
     
     def _analyze_description(self) -> dict:
         """Analyze meta description"""
-        desc_tag = self.soup.find('meta', attrs={'name': 'description'})
+        desc_tag = self._first_meta(self.meta_by_name, 'description')
         
         if not desc_tag or not desc_tag.get('content'):
-            self.issues.append({
-                'type': 'warning',
-                'category': 'meta',
-                'message': 'Missing meta description',
-                'recommendation': 'Add a compelling meta description (150-160 characters)',
-                'impact': 'high'
-            })
+            self.issues.append(Issue(
+                type='warning',
+                category='meta',
+                message='Missing meta description',
+                recommendation='Add a compelling meta description (150-160 characters)',
+                impact='high'
+            ))
             return {
                 'value': None,
                 'length': 0,
@@ -129,26 +165,26 @@ class MetaAnalyzer:
         issues = []
         
         # Check length
-        if desc_length < settings.DESCRIPTION_MIN_LENGTH:
+        if desc_length < DESCRIPTION_MIN_LENGTH:
             status = 'warning'
             issues.append(f'Description too short ({desc_length} chars)')
-            self.issues.append({
-                'type': 'warning',
-                'category': 'meta',
-                'message': f'Meta description too short: {desc_length} characters',
-                'recommendation': f'Expand to {settings.DESCRIPTION_MIN_LENGTH}-{settings.DESCRIPTION_MAX_LENGTH} characters',
-                'impact': 'medium'
-            })
-        elif desc_length > settings.DESCRIPTION_MAX_LENGTH:
+            self.issues.append(Issue(
+                type='warning',
+                category='meta',
+                message=f'Meta description too short: {desc_length} characters',
+                recommendation=f'Expand to {DESCRIPTION_RANGE} characters',
+                impact='medium'
+            ))
+        elif desc_length > DESCRIPTION_MAX_LENGTH:
             status = 'warning'
             issues.append(f'Description too long ({desc_length} chars)')
-            self.issues.append({
-                'type': 'warning',
-                'category': 'meta',
-                'message': f'Meta description too long: {desc_length} characters',
-                'recommendation': f'Shorten to {settings.DESCRIPTION_MIN_LENGTH}-{settings.DESCRIPTION_MAX_LENGTH} characters',
-                'impact': 'medium'
-            })
+            self.issues.append(Issue(
+                type='warning',
+                category='meta',
+                message=f'Meta description too long: {desc_length} characters',
+                recommendation=f'Shorten to {DESCRIPTION_RANGE} characters',
+                impact='medium'
+            ))
         
         return {
             'value': desc_text,
@@ -179,7 +215,7 @@ class MetaAnalyzer:
     
     def _analyze_robots(self) -> dict:
         """Analyze robots meta tag"""
-        robots_tag = self.soup.find('meta', attrs={'name': 'robots'})
+        robots_tag = self._first_meta(self.meta_by_name, 'robots')
         
         if not robots_tag:
             return {
@@ -200,10 +236,10 @@ class MetaAnalyzer:
         """Analyze Open Graph tags"""
         og_tags = {}
         
-        for tag in self.soup.find_all('meta', attrs={'property': lambda x: x and x.startswith('og:')}):
-            property_name = tag.get('property', '')
-            content = sanitize_text(tag.get('content', ''))
-            og_tags[property_name] = content
+        for property_name, tags in self.meta_by_property.items():
+            if property_name.startswith('og:'):
+                for tag in tags:
+                    og_tags[property_name] = sanitize_text(tag.get('content', ''))
         
         return og_tags
     
@@ -211,25 +247,25 @@ class MetaAnalyzer:
         """Analyze Twitter Card tags"""
         twitter_tags = {}
         
-        for tag in self.soup.find_all('meta', attrs={'name': lambda x: x and x.startswith('twitter:')}):
-            name = tag.get('name', '')
-            content = sanitize_text(tag.get('content', ''))
-            twitter_tags[name] = content
+        for name, tags in self.meta_by_name.items():
+            if name.startswith('twitter:'):
+                for tag in tags:
+                    twitter_tags[name] = sanitize_text(tag.get('content', ''))
         
         return twitter_tags
     
     def _analyze_viewport(self) -> str:
         """Analyze viewport meta tag"""
-        viewport_tag = self.soup.find('meta', attrs={'name': 'viewport'})
+        viewport_tag = self._first_meta(self.meta_by_name, 'viewport')
         
         if not viewport_tag:
-            self.issues.append({
-                'type': 'warning',
-                'category': 'meta',
-                'message': 'Missing viewport meta tag',
-                'recommendation': 'Add viewport meta tag for mobile responsiveness',
-                'impact': 'low'
-            })
+            self.issues.append(Issue(
+                type='warning',
+                category='meta',
+                message='Missing viewport meta tag',
+                recommendation='Add viewport meta tag for mobile responsiveness',
+                impact='low'
+            ))
             return None
         
         return viewport_tag.get('content', '')
@@ -239,26 +275,26 @@ class MetaAnalyzer:
         html_tag = self.soup.find('html')
         
         if not html_tag or not html_tag.get('lang'):
-            self.issues.append({
-                'type': 'info',
-                'category': 'meta',
-                'message': 'Missing language declaration',
-                'recommendation': 'Add lang attribute to html tag',
-                'impact': 'low'
-            })
+            self.issues.append(Issue(
+                type='info',
+                category='meta',
+                message='Missing language declaration',
+                recommendation='Add lang attribute to html tag',
+                impact='low'
+            ))
             return None
         
         return html_tag.get('lang', '')
     
     def _analyze_charset(self) -> str:
         """Analyze charset declaration"""
-        charset_tag = self.soup.find('meta', attrs={'charset': True})
+        charset_tag = self.charset_meta
         
         if charset_tag:
             return charset_tag.get('charset', '')
         
         # Check http-equiv
-        content_type_tag = self.soup.find('meta', attrs={'http-equiv': 'Content-Type'})
+        content_type_tag = self._first_meta(self.meta_by_http_equiv, 'Content-Type')
         if content_type_tag:
             content = content_type_tag.get('content', '')
             if 'charset=' in content:
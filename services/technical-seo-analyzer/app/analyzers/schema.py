@@ -1,18 +1,46 @@
 import json
-from app.utils.fetcher import parse_html
+import orjson
+from bs4 import BeautifulSoup
+from app.analyzers._constants import JSON_LD_TYPE, RECOMMENDED_SCHEMA_TYPES
+from app.utils.issue import Issue
 from app.utils.scorer import calculate_score_from_issues
 
+
+def _iter_schema_items(data):
+    """Yield JSON-LD nodes in document order, flattening lists and @graph containers"""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            if '@graph' in node:
+                stack.append(node['@graph'])
+            else:
+                yield node
+
+
+def _loads_json_ld(text: str):
+    """Parse a JSON-LD block, falling back to json for the NaN/Infinity literals orjson rejects"""
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
 class SchemaAnalyzer:
     """Analyze structured data (Schema.org JSON-LD)"""
     
-    def __init__(self, html_content: str):
-        self.soup = parse_html(html_content)
+    __slots__ = ('soup', 'issues')
+    
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
         self.issues = []
     
     def analyze(self) -> dict:
         """Run full schema analysis"""
         # Find all JSON-LD scripts
-        json_ld_scripts = self.soup.find_all('script', type='application/ld+json')
+        json_ld_scripts = self.soup.find_all('script', type=JSON_LD_TYPE)
         
         schemas = []
         schema_types = []
@@ -21,18 +49,10 @@ class SchemaAnalyzer:
         
         for script in json_ld_scripts:
             try:
-                data = json.loads(script.string)
-                
-                # Handle @graph
-                if isinstance(data, dict) and '@graph' in data:
-                    items = data['@graph']
-                elif isinstance(data, list):
-                    items = data
-                else:
-                    items = [data]
+                data = _loads_json_ld(str(script.string or ''))
                 
-                for item in items:
-                    if isinstance(item, dict) and '@type' in item:
+                for item in _iter_schema_items(data):
+                    if '@type' in item:
                         schema_type = item['@type']
                         schema_types.append(schema_type)
                         schemas.append({
@@ -44,27 +64,26 @@ class SchemaAnalyzer:
                     
             except json.JSONDecodeError:
                 invalid_count += 1
-                self.issues.append({
-                    'type': 'error',
-                    'category': 'schema',
-                    'message': 'Invalid JSON-LD syntax',
-                    'recommendation': 'Fix JSON-LD syntax errors',
-                    'impact': 'medium'
-                })
+                self.issues.append(Issue(
+                    type='error',
+                    category='schema',
+                    message='Invalid JSON-LD syntax',
+                    recommendation='Fix JSON-LD syntax errors',
+                    impact='medium'
+                ))
         
         # Check if schema exists
         if not schemas:
-            self.issues.append({
-                'type': 'info',
-                'category': 'schema',
-                'message': 'No structured data found',
-                'recommendation': 'Add Schema.org structured data for rich results',
-                'impact': 'medium'
-            })
+            self.issues.append(Issue(
+                type='info',
+                category='schema',
+                message='No structured data found',
+                recommendation='Add Schema.org structured data for rich results',
+                impact='medium'
+            ))
         
         # Check for important schema types
-        recommended_types = ['Organization', 'WebSite', 'WebPage', 'Article', 'Product', 'BreadcrumbList']
-        missing_recommended = [t for t in recommended_types if t not in schema_types]
+        missing_recommended = [t for t in RECOMMENDED_SCHEMA_TYPES if t not in schema_types]
         
         score = calculate_score_from_issues(self.issues)
         
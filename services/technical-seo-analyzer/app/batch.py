@@ -0,0 +1,72 @@
+"""
+Batch analysis for bulk SEO audits.
+
+Pages are fetched and analyzed concurrently on the event loop, with a bounded
+number of URLs in flight. Fetching and analysis are passed in by the caller,
+so a batch shares the HTTP client, browser pool and caches of /analyze.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Base delay (seconds) for exponential backoff between fetch retries
+RETRY_BACKOFF = 1.0
+
+
+async def _fetch_with_retry(url: str, fetch: Callable[[str], Awaitable[str]], retries: int) -> str:
+    """Fetch HTML, retrying failed requests with exponential backoff."""
+    for attempt in range(retries + 1):
+        try:
+            return await fetch(url)
+        except Exception as e:
+            if attempt == retries:
+                raise
+            delay = RETRY_BACKOFF * (2 ** attempt)
+            logger.warning("Fetch failed for %s (attempt %s): %s. Retrying in %ss", url, attempt + 1, e, delay)
+            await asyncio.sleep(delay)
+
+
+async def analyze_many(
+    urls: List[str],
+    fetch: Callable[[str], Awaitable[str]],
+    analyze: Callable[[str, str], Awaitable[Dict[str, Any]]],
+    concurrency: int = 8,
+    retries: int = 2
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Analyze multiple URLs concurrently.
+
+    Args:
+        urls: URLs to analyze (duplicates are analyzed once)
+        fetch: Coroutine function returning the HTML of a URL
+        analyze: Coroutine function building the analysis of (url, html)
+        concurrency: Maximum number of pages fetched/analyzed at once
+        retries: Retries per URL when fetching fails
+
+    Returns:
+        Mapping of URL to analysis result, or to {'error': message} on failure
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    total = len(unique_urls)
+    semaphore = asyncio.Semaphore(concurrency)
+    done = 0
+
+    async def analyze_one(url: str) -> Dict[str, Any]:
+        nonlocal done
+        async with semaphore:
+            try:
+                html_content = await _fetch_with_retry(url, fetch, retries)
+                result = await analyze(url, html_content)
+            except Exception as e:
+                logger.error("Batch analysis failed for %s: %s", url, e)
+                result = {'error': str(e)}
+
+        done += 1
+        logger.info("Batch progress: %s/%s (%s)", done, total, url)
+        return result
+
+    results = await asyncio.gather(*(analyze_one(url) for url in unique_urls))
+    return dict(zip(unique_urls, results))
@@ -21,8 +21,12 @@ class Settings:
     # Timeouts
     REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30"))
     
+    # Server (each worker runs its own Playwright browser and caches)
+    WORKERS = int(os.getenv("WORKERS", "1"))
+    
     # Logging
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT = os.getenv("LOG_FORMAT", "text")  # "text" or "json"
     
     # Redis (optional)
     REDIS_URL = os.getenv("REDIS_URL", "")
@@ -1,21 +1,67 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, HttpUrl
 from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hashlib
+import itertools
 import logging
+import operator
+import orjson
 from datetime import datetime
+from app.batch import analyze_many
+from app.config import settings
+from app.pipeline import analyze_page_async, extract_page_async
+from app.scraper.renderer import get_rendered_html_async, warmup, is_ready, cleanup
+from app.utils.cache import TTLCache
+from app.utils.fetcher import cached_fetch, create_http_client, fetch_html
+from app.utils.issue import serialize_issues
+from app.utils.log_format import configure_logging
+from app.utils.scorer import calculate_overall_score
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+configure_logging(settings.LOG_LEVEL, settings.LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
 # Create FastAPI app
 app = FastAPI(
     title="Technical SEO Analyzer",
     description="AI-powered technical SEO analysis microservice with Playwright rendering",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Worker threads for CPU-bound parsing/analysis run off the event loop
+ANALYSIS_THREADS = 16
+
+# Full /analyze payloads (with their ETag) are reused briefly for repeat requests
+ANALYZE_RESPONSE_TTL = 60
+_analyze_response_cache = TTLCache(maxsize=128, ttl=ANALYZE_RESPONSE_TTL)
+
+# Bump when analyzer output changes so clients drop stale ETags
+ANALYSIS_VERSION = "v3"
+
+# Sent with analyses and their 304s; clients may reuse an analysis as long as the server cache does
+ANALYZE_CACHE_CONTROL = f"private, max-age={ANALYZE_RESPONSE_TTL}"
+
+# (score key, minimum score, recommendation) applied in order after high-impact issues
+RECOMMENDATION_RULES = (
+    ('meta', 70, "Improve meta tags (title and description) for better SERP appearance"),
+    ('headings', 70, "Fix heading structure to improve content hierarchy"),
+    ('images', 70, "Add descriptive alt text to all images for accessibility and SEO"),
+    ('schema', 50, "Implement structured data (Schema.org) for rich results"),
+    ('content', 70, "Improve content quality and readability"),
+)
+
+# /extract payload fields streamed as separate NDJSON lines instead of in the header
+STREAMED_TEXT_FIELDS = ('full_text', 'html')
+
+# /analyze/batch limits
+MAX_BATCH_URLS = 100
+MAX_BATCH_CONCURRENCY = 16
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -39,6 +85,13 @@ class ScrapeRequest(BaseModel):
     min_words: Optional[int] = 150
     scroll_wait_ms: Optional[int] = 2000
 
+class BatchAnalyzeRequest(BaseModel):
+    urls: List[HttpUrl]
+    use_playwright: Optional[bool] = True
+    concurrency: Optional[int] = 8
+    timeout_ms: Optional[int] = 60000
+    min_words: Optional[int] = 150
+
 class HealthResponse(BaseModel):
     status: str
     timestamp: str
@@ -55,7 +108,7 @@ class AnalyzeResponse(BaseModel):
     images: dict
     url_structure: dict
     schema_markup: dict
-    content_quality: dict
+    content_quality: dict  # its 'extracted' elements are text-only (no 'html'); see extracted_content
     issues: list
     recommendations: list
     # New fields from scraper
@@ -73,37 +126,44 @@ class ScrapeResponse(BaseModel):
 async def startup_event():
     """Initialize resources on startup."""
     logger.info("Starting Technical SEO Analyzer with Playwright support")
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=ANALYSIS_THREADS))
+    # One pooled HTTP client shared by all plain (non-Playwright) fetches
+    app.state.http = create_http_client()
+    
+    # Launch the browser now so the first render doesn't pay for it
+    try:
+        await warmup()
+    except Exception as e:
+        logger.error("Playwright warmup failed: %s", e)
 
 # Shutdown event - cleanup Playwright
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on shutdown."""
     try:
-        from app.scraper.renderer import cleanup
+        await app.state.http.aclose()
+    except Exception as e:
+        logger.error("Error closing HTTP client: %s", e)
+    
+    try:
         await cleanup()
         logger.info("Playwright cleaned up successfully")
     except Exception as e:
-        logger.error(f"Error during cleanup: {e}")
+        logger.error("Error during cleanup: %s", e)
 
 # Health check endpoint
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint for monitoring"""
-    playwright_ready = False
-    try:
-        # Quick check if playwright is importable
-        from app.scraper.renderer import _browser
-        playwright_ready = True
-    except:
-        pass
-    
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.utcnow().isoformat(),
-        service="Technical SEO Analyzer",
-        version="2.0.0",
-        playwright_ready=playwright_ready
-    )
+    # Hit often by load balancers: return the response directly so it is not
+    # re-validated through HealthResponse (kept for the OpenAPI schema)
+    return ORJSONResponse({
+        "status": "healthy",
+        "timestamp": datetime.utcnow().isoformat(),
+        "service": "Technical SEO Analyzer",
+        "version": "2.0.0",
+        "playwright_ready": is_ready(),
+    })
 
 # New scrape-only endpoint
 @app.post("/scrape", response_model=ScrapeResponse)
@@ -115,33 +175,23 @@ async def scrape_url(request: ScrapeRequest):
     """
     try:
         url_str = str(request.url)
-        logger.info(f"Scraping URL: {url_str} (Playwright: {request.use_playwright})")
-        
-        from app.scraper.renderer import get_rendered_html_async
-        from app.scraper.extractor import extract_content, extract_full_text
-        from app.utils.fetcher import fetch_html
+        logger.info("Scraping URL: %s (Playwright: %s)", url_str, request.use_playwright)
         
         # Fetch HTML with full rendering
-        if request.use_playwright:
-            html_content = await get_rendered_html_async(
-                url_str,
-                timeout_ms=request.timeout_ms or 60000,
-                min_words=request.min_words or 150,
-                scroll_wait_ms=request.scroll_wait_ms or 2000
-            )
-        else:
-            html_content = await fetch_html(url_str)
+        html_content = await fetch_page(
+            url_str, request.use_playwright, request.timeout_ms, request.min_words, request.scroll_wait_ms
+        )
         
         # Extract content using multi-strategy extraction
-        content_data = extract_content(html_content)
+        content_data = await extract_page_async(html_content)
         
         # Log extraction stats
         word_count = content_data.get('metadata', {}).get('word_count', 0)
-        logger.info(f"Extracted {word_count} words from {url_str}")
+        logger.info("Extracted %s words from %s", word_count, url_str)
         
         # Warn if low word count
         if word_count < 100:
-            logger.warning(f"Low word count ({word_count}) for {url_str}")
+            logger.warning("Low word count (%s) for %s", word_count, url_str)
         
         return ScrapeResponse(
             url=url_str,
@@ -161,150 +211,223 @@ async def scrape_url(request: ScrapeRequest):
         )
         
     except Exception as e:
-        logger.error(f"Scraping failed for {request.url}: {str(e)}")
+        logger.exception("Scraping failed for %s", request.url)
         raise HTTPException(status_code=500, detail=f"Scraping failed: {str(e)}")
 
 # Analysis endpoint with Playwright integration
 @app.post("/analyze", response_model=AnalyzeResponse)
-async def analyze_url(request: AnalyzeRequest):
+async def analyze_url(request: AnalyzeRequest, http_request: Request):
     """
     Analyze a URL for technical SEO issues.
     Uses Playwright for JavaScript rendering when enabled.
     Returns comprehensive analysis including meta tags, headings, images, etc.
+    Supports conditional requests: a matching If-None-Match returns 304.
     """
     try:
         url_str = str(request.url)
-        logger.info(f"Analyzing URL: {url_str} (Playwright: {request.use_playwright})")
+        logger.info("Analyzing URL: %s (Playwright: %s)", url_str, request.use_playwright)
+        if_none_match = http_request.headers.get('if-none-match')
         
-        # Import analyzers (lazy import to avoid startup issues)
-        from app.analyzers.meta import MetaAnalyzer
-        from app.analyzers.headings import HeadingAnalyzer
-        from app.analyzers.images import ImageAnalyzer
-        from app.analyzers.url import URLAnalyzer
-        from app.analyzers.schema import SchemaAnalyzer
-        from app.analyzers.content_quality import ContentQualityAnalyzer
-        from app.utils.fetcher import fetch_html
-        from app.utils.scorer import calculate_overall_score
+        cache_key = (url_str, request.use_playwright, request.timeout_ms, request.min_words)
+        cached = _analyze_response_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Analysis cache hit for %s", url_str)
+            payload, etag = cached
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers=cache_headers(etag))
+            return ORJSONResponse(content=payload, headers=cache_headers(etag))
         
         # Fetch HTML using Playwright or standard HTTP
-        if request.use_playwright:
-            from app.scraper.renderer import get_rendered_html_async
-            from app.scraper.extractor import extract_content
-            
-            html_content = await get_rendered_html_async(
-                url_str,
-                timeout_ms=request.timeout_ms or 60000,
-                min_words=request.min_words or 150,
-                scroll_wait_ms=2000
-            )
-            
-            # Extract structured content using multi-strategy extraction
-            extracted_content = extract_content(html_content)
-            word_count = extracted_content.get('metadata', {}).get('word_count', 0)
-            logger.info(f"Playwright extracted {word_count} words")
-            
-            if word_count < 100:
-                logger.warning(f"Low word count ({word_count}) for {url_str}")
-        else:
-            html_content = await fetch_html(url_str)
-            extracted_content = None
-        
-        # Run all analyzers
-        meta_analyzer = MetaAnalyzer(url_str, html_content)
-        heading_analyzer = HeadingAnalyzer(html_content)
-        image_analyzer = ImageAnalyzer(html_content)
-        url_analyzer = URLAnalyzer(url_str)
-        schema_analyzer = SchemaAnalyzer(html_content)
-        content_analyzer = ContentQualityAnalyzer(html_content)
-        
-        meta_result = meta_analyzer.analyze()
-        headings_result = heading_analyzer.analyze()
-        images_result = image_analyzer.analyze()
-        url_result = url_analyzer.analyze()
-        schema_result = schema_analyzer.analyze()
-        content_result = content_analyzer.analyze()
-        
-        # If we have extracted content, enhance content_result
-        if extracted_content:
-            content_result['extracted'] = {
-                'full_text': extracted_content.get('full_text', ''),
-                'word_count': extracted_content.get('metadata', {}).get('word_count', 0),
-                'headings': extracted_content.get('headings', []),
-                'paragraphs': [p.get('text', '') for p in extracted_content.get('paragraphs', [])],
-                'lists': extracted_content.get('lists', []),
-                'tables': extracted_content.get('tables', []),
-                'blockquotes': extracted_content.get('blockquotes', []),
-                'elements_in_order': extracted_content.get('elements_in_order', []),
-            }
+        html_content = await fetch_page(url_str, request.use_playwright, request.timeout_ms, request.min_words)
         
-        # Calculate scores
-        scores = calculate_overall_score({
-            'meta': meta_result,
-            'headings': headings_result,
-            'images': images_result,
-            'url': url_result,
-            'schema': schema_result,
-            'content': content_result
-        })
+        # Unchanged page: skip analysis and serialization entirely
+        etag = analysis_etag(url_str, request.use_playwright, html_content)
+        if etag_matches(if_none_match, etag):
+            logger.info("Analysis not modified for %s", url_str)
+            return Response(status_code=304, headers=cache_headers(etag))
         
-        # Collect all issues
-        all_issues = []
-        all_issues.extend(meta_result.get('issues', []))
-        all_issues.extend(headings_result.get('issues', []))
-        all_issues.extend(images_result.get('issues', []))
-        all_issues.extend(url_result.get('issues', []))
-        all_issues.extend(schema_result.get('issues', []))
-        all_issues.extend(content_result.get('issues', []))
+        payload = await build_analysis(url_str, request.use_playwright, html_content)
         
-        # Generate recommendations
-        recommendations = generate_recommendations(all_issues, scores)
+        # Returned as a response directly: the payload is already plain data,
+        # so re-validating it through AnalyzeResponse would only duplicate work
+        _analyze_response_cache.set(cache_key, (payload, etag))
         
-        return AnalyzeResponse(
-            url=url_str,
-            analyzed_at=datetime.utcnow().isoformat(),
-            score=scores,
-            meta=meta_result,
-            headings=headings_result,
-            images=images_result,
-            url_structure=url_result,
-            schema_markup=schema_result,
-            content_quality=content_result,
-            issues=sorted(all_issues, key=lambda x: {'high': 0, 'medium': 1, 'low': 2}.get(x.get('impact', 'low'), 2)),
-            recommendations=recommendations[:10],  # Top 10 recommendations
-            extracted_content=extracted_content
-        )
+        return ORJSONResponse(content=payload, headers=cache_headers(etag))
         
     except Exception as e:
-        logger.error(f"Analysis failed for {request.url}: {str(e)}")
+        logger.exception("Analysis failed for %s", request.url)
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
+# Batch analysis endpoint
+@app.post("/analyze/batch")
+async def analyze_batch(request: BatchAnalyzeRequest):
+    """
+    Analyze several URLs concurrently.
+    Shares the HTTP client, browser pool and every cache with /analyze.
+    Returns a mapping of URL to analysis result, or to {"error": message} on failure.
+    """
+    if len(request.urls) > MAX_BATCH_URLS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_URLS} URLs per batch")
+    
+    urls = [str(url) for url in request.urls]
+    concurrency = min(max(request.concurrency or 1, 1), MAX_BATCH_CONCURRENCY)
+    logger.info("Batch analyzing %s URLs (Playwright: %s)", len(urls), request.use_playwright)
+    
+    return await analyze_many(
+        urls,
+        fetch=lambda url_str: fetch_page(url_str, request.use_playwright, request.timeout_ms, request.min_words),
+        analyze=lambda url_str, html_content: build_analysis(url_str, request.use_playwright, html_content),
+        concurrency=concurrency
+    )
+
+def _without_markup(value: Any) -> Any:
+    """Copy of extracted items with every per-element 'html' field dropped"""
+    if isinstance(value, list):
+        return [_without_markup(item) for item in value]
+    if isinstance(value, dict):
+        return {k: _without_markup(v) for k, v in value.items() if k != 'html'}
+    return value
+
+
+async def build_analysis(url_str: str, use_playwright: bool, html_content: str) -> Dict[str, Any]:
+    """Run the full analysis of fetched HTML and build the /analyze payload"""
+    if use_playwright:
+        # Extract structured content using multi-strategy extraction
+        extracted_content = await extract_page_async(html_content)
+        word_count = extracted_content.get('metadata', {}).get('word_count', 0)
+        logger.info("Playwright extracted %s words", word_count)
+
+        if word_count < 100:
+            logger.warning("Low word count (%s) for %s", word_count, url_str)
+    else:
+        extracted_content = None
+
+    # Parse once and run all analyzers on the shared tree, off the event loop
+    # (byte-identical HTML reuses cached analyzer results)
+    results = await analyze_page_async(url_str, html_content)
+
+    meta_result = results['meta']
+    headings_result = results['headings']
+    images_result = results['images']
+    url_result = results['url']
+    schema_result = results['schema']
+    content_result = results['content']
+
+    # If we have extracted content, enhance content_result
+    if extracted_content:
+        content_result['extracted'] = {
+            'full_text': extracted_content.get('full_text', ''),
+            'word_count': extracted_content.get('metadata', {}).get('word_count', 0),
+            # The content analysis only needs element text; the markup stays
+            # in extracted_content
+            'headings': _without_markup(extracted_content.get('headings', [])),
+            'paragraphs': [p.get('text', '') for p in extracted_content.get('paragraphs', [])],
+            'lists': _without_markup(extracted_content.get('lists', [])),
+            'tables': _without_markup(extracted_content.get('tables', [])),
+            'blockquotes': _without_markup(extracted_content.get('blockquotes', [])),
+            'elements_in_order': _without_markup(extracted_content.get('elements_in_order', [])),
+        }
+
+    # Calculate scores
+    scores = calculate_overall_score({
+        'meta': meta_result,
+        'headings': headings_result,
+        'images': images_result,
+        'url': url_result,
+        'schema': schema_result,
+        'content': content_result
+    })
+
+    # Collect all issues
+    all_issues = list(itertools.chain.from_iterable(
+        result.get('issues', ())
+        for result in (meta_result, headings_result, images_result, url_result, schema_result, content_result)
+    ))
+
+    # Most severe first (stable, so analyzer order is kept within a level)
+    all_issues.sort(key=operator.attrgetter('impact_rank'))
+
+    # Generate recommendations
+    recommendations = generate_recommendations(all_issues, scores)
+
+    # Serialize issues at the response boundary
+    for result in (meta_result, headings_result, images_result, url_result, schema_result, content_result):
+        result['issues'] = serialize_issues(result['issues'])
+
+    return {
+        'url': url_str,
+        'analyzed_at': datetime.utcnow().isoformat(),
+        'score': scores,
+        'meta': meta_result,
+        'headings': headings_result,
+        'images': images_result,
+        'url_structure': url_result,
+        'schema_markup': schema_result,
+        'content_quality': content_result,
+        'issues': serialize_issues(all_issues),
+        'recommendations': recommendations[:10],  # Top 10 recommendations
+        'extracted_content': extracted_content
+    }
+
+async def fetch_page(url_str: str, use_playwright: bool, timeout_ms: Optional[int] = None,
+                     min_words: Optional[int] = None, scroll_wait_ms: Optional[int] = None) -> str:
+    """Fetch page HTML through the shared fetch cache (rendered with Playwright or plain HTTP)"""
+    if use_playwright:
+        # Render settings are part of the cache key: a short render must not
+        # be served to a caller that asked for a longer one
+        options = (timeout_ms or 60000, min_words or 150, scroll_wait_ms or 2000)
+        return await cached_fetch(url_str, lambda: get_rendered_html_async(
+            url_str,
+            timeout_ms=options[0],
+            min_words=options[1],
+            scroll_wait_ms=options[2]
+        ), kind='playwright', options=options)
+    return await cached_fetch(url_str, lambda: fetch_html(url_str, client=app.state.http))
+
+def analysis_etag(url: str, use_playwright: bool, html_content: str) -> str:
+    """Weak ETag for an analysis: hash of URL, fetch mode and page HTML plus the analyzer version"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{url}\n{use_playwright}\n".encode())
+    digest.update(html_content.encode('utf-8', 'surrogatepass'))
+    return f'W/"{digest.hexdigest()}-{ANALYSIS_VERSION}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check: '*' or any listed tag, compared weakly (W/ prefix ignored)"""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix('W/')
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == opaque:
+            return True
+    return False
+
+def cache_headers(etag: str) -> Dict[str, str]:
+    """Validator and freshness headers sent with analyses and their 304s"""
+    return {'ETag': etag, 'Cache-Control': ANALYZE_CACHE_CONTROL}
+
 def generate_recommendations(issues: list, scores: dict) -> list:
     """Generate prioritized recommendations based on issues and scores"""
     recommendations = []
+    seen = set()
+
+    def add(recommendation: str):
+        # Skip duplicates while keeping first-seen order
+        if recommendation not in seen:
+            seen.add(recommendation)
+            recommendations.append(recommendation)
     
     # High priority issues first
-    high_priority = [i for i in issues if i.get('impact') == 'high']
-    if high_priority:
-        for issue in high_priority[:5]:
-            recommendations.append(issue.get('recommendation', issue.get('message', '')))
+    high_priority = [i for i in issues if i.impact == 'high']
+    for issue in high_priority[:5]:
+        add(issue.recommendation or issue.message)
     
     # Score-based recommendations
-    if scores.get('meta', 0) < 70:
-        recommendations.append("Improve meta tags (title and description) for better SERP appearance")
-    
-    if scores.get('headings', 0) < 70:
-        recommendations.append("Fix heading structure to improve content hierarchy")
-    
-    if scores.get('images', 0) < 70:
-        recommendations.append("Add descriptive alt text to all images for accessibility and SEO")
+    for key, threshold, recommendation in RECOMMENDATION_RULES:
+        if scores.get(key, 0) < threshold:
+            add(recommendation)
     
-    if scores.get('schema', 0) < 50:
-        recommendations.append("Implement structured data (Schema.org) for rich results")
-    
-    if scores.get('content_quality', 0) < 70:
-        recommendations.append("Improve content quality and readability")
-    
-    return list(dict.fromkeys(recommendations))  # Remove duplicates
+    return recommendations
 
 # Quick check endpoint (faster, less detailed)
 @app.post("/analyze/quick")
@@ -312,17 +435,13 @@ async def quick_analyze(request: AnalyzeRequest):
     """Quick analysis focusing on critical issues only"""
     try:
         url_str = str(request.url)
-        logger.info(f"Quick analyzing URL: {url_str}")
-        
-        from app.analyzers.meta import MetaAnalyzer
-        from app.utils.fetcher import fetch_html
+        logger.info("Quick analyzing URL: %s", url_str)
         
         # Use standard HTTP for quick analysis (faster)
-        html_content = await fetch_html(url_str)
-        meta_analyzer = MetaAnalyzer(url_str, html_content)
-        meta_result = meta_analyzer.analyze()
+        html_content = await fetch_page(url_str, use_playwright=False)
+        meta_result = (await analyze_page_async(url_str, html_content, ['meta']))['meta']
         
-        critical_issues = [i for i in meta_result.get('issues', []) if i.get('impact') == 'high']
+        critical_issues = serialize_issues([i for i in meta_result.get('issues', []) if i.impact == 'high'])
         
         return {
             "url": url_str,
@@ -332,47 +451,39 @@ async def quick_analyze(request: AnalyzeRequest):
         }
         
     except Exception as e:
-        logger.error(f"Quick analysis failed: {str(e)}")
+        logger.exception("Quick analysis failed for %s", request.url)
         raise HTTPException(status_code=500, detail=str(e))
 
 # Content extraction endpoint (for EEAT analysis)
 @app.post("/extract")
-async def extract_content_endpoint(request: ScrapeRequest):
+async def extract_content_endpoint(request: ScrapeRequest, http_request: Request):
     """
     Extract content from URL for EEAT analysis.
     Returns full_text suitable for AI analysis.
     Uses full DOM walker for complete content extraction.
+    Clients sending `Accept: application/x-ndjson` get the payload streamed
+    as newline-delimited JSON (see stream_extract_payload).
     """
     try:
         url_str = str(request.url)
-        logger.info(f"Extracting content from: {url_str}")
-        
-        from app.scraper.renderer import get_rendered_html_async
-        from app.scraper.extractor import extract_content, extract_full_text
-        from app.utils.fetcher import fetch_html
+        logger.info("Extracting content from: %s", url_str)
         
         # Fetch HTML using Playwright for full JS rendering
-        if request.use_playwright:
-            html_content = await get_rendered_html_async(
-                url_str,
-                timeout_ms=request.timeout_ms or 60000,
-                min_words=request.min_words or 150,
-                scroll_wait_ms=request.scroll_wait_ms or 2000
-            )
-        else:
-            html_content = await fetch_html(url_str)
+        html_content = await fetch_page(
+            url_str, request.use_playwright, request.timeout_ms, request.min_words, request.scroll_wait_ms
+        )
         
         # Extract content using multi-strategy extraction
-        content_data = extract_content(html_content)
+        content_data = await extract_page_async(html_content)
         
         # Log extraction result
         word_count = content_data.get('metadata', {}).get('word_count', 0)
-        logger.info(f"Extracted {word_count} words from {url_str}")
+        logger.info("Extracted %s words from %s", word_count, url_str)
         
         if word_count < 100:
-            logger.warning(f"Low word count for EEAT analysis: {word_count}")
+            logger.warning("Low word count for EEAT analysis: %s", word_count)
         
-        return {
+        payload = {
             "url": url_str,
             "extracted_at": datetime.utcnow().isoformat(),
             "title": content_data.get('metadata', {}).get('title', ''),
@@ -393,10 +504,37 @@ async def extract_content_endpoint(request: ScrapeRequest):
             "used_playwright": request.use_playwright,
         }
         
+        if 'application/x-ndjson' in http_request.headers.get('accept', ''):
+            return StreamingResponse(stream_extract_payload(payload), media_type='application/x-ndjson')
+        return payload
+        
     except Exception as e:
-        logger.error(f"Content extraction failed: {str(e)}")
+        logger.exception("Content extraction failed for %s", request.url)
         raise HTTPException(status_code=500, detail=f"Extraction failed: {str(e)}")
 
+def stream_extract_payload(payload: dict):
+    """
+    Serialize an /extract payload as newline-delimited JSON, one line at a time.
+
+    The first line holds the small scalar fields and the statistics; each item
+    of a list section then follows as {"section": name, "item": item}, and each
+    large text field (see STREAMED_TEXT_FIELDS) comes last as its own
+    {"field": name, "value": text} line. No single buffer ever holds more than
+    one line, so the largest allocation is the page markup alone.
+    """
+    header = {
+        key: value for key, value in payload.items()
+        if not isinstance(value, list) and key not in STREAMED_TEXT_FIELDS
+    }
+    yield orjson.dumps(header) + b'\n'
+    for section, items in payload.items():
+        if isinstance(items, list):
+            for item in items:
+                yield orjson.dumps({"section": section, "item": item}) + b'\n'
+    for field in STREAMED_TEXT_FIELDS:
+        if field in payload:
+            yield orjson.dumps({"field": field, "value": payload[field]}) + b'\n'
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -413,6 +551,7 @@ async def root():
         "endpoints": {
             "health": "/health",
             "analyze": "POST /analyze (full analysis with Playwright)",
+            "analyze_batch": "POST /analyze/batch (several URLs concurrently)",
             "quick_analyze": "POST /analyze/quick (fast, basic analysis)",
             "scrape": "POST /scrape (content scraping only)",
             "extract": "POST /extract (content extraction for EEAT)"
@@ -421,4 +560,13 @@ async def root():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop/httptools ship with uvicorn[standard]
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=settings.WORKERS,
+        log_level=settings.LOG_LEVEL.lower(),
+    )
@@ -0,0 +1,221 @@
+"""
+Shared analysis pipeline.
+
+The page is parsed once and every analyzer runs on the same tree. Each
+analyzer is exposed as a stateless module-level function taking
+(url, soup), so the request handlers and the batch orchestrator share a
+single definition of what "analyze a page" means.
+
+Analyzer results and structured content extraction are cached on a hash of
+the HTML, so every endpoint that sees the same page (e.g. /scrape followed
+by /analyze) reuses the work done by the others.
+"""
+
+import asyncio
+import hashlib
+from typing import Any, Callable, Dict, Iterable, Optional
+from bs4 import BeautifulSoup
+
+from app.analyzers.meta import MetaAnalyzer
+from app.analyzers.headings import HeadingAnalyzer
+from app.analyzers.images import ImageAnalyzer
+from app.analyzers.url import URLAnalyzer
+from app.analyzers.schema import SchemaAnalyzer
+from app.analyzers.content_quality import ContentQualityAnalyzer
+from app.scraper.extractor import extract_content
+from app.utils.cache import TTLCache
+from app.utils.fetcher import parse_html
+
+
+def analyze_meta(url: str, soup: BeautifulSoup) -> Dict[str, Any]:
+    """Analyze meta tags"""
+    return MetaAnalyzer(url, soup).analyze()
+
+
+def analyze_headings(url: str, soup: BeautifulSoup) -> Dict[str, Any]:
+    """Analyze heading structure"""
+    return HeadingAnalyzer(soup).analyze()
+
+
+def analyze_images(url: str, soup: BeautifulSoup) -> Dict[str, Any]:
+    """Analyze images"""
+    return ImageAnalyzer(soup).analyze()
+
+
+def analyze_url_structure(url: str, soup: BeautifulSoup) -> Dict[str, Any]:
+    """Analyze URL structure (the page itself is not needed)"""
+    return URLAnalyzer(url).analyze()
+
+
+def analyze_schema(url: str, soup: BeautifulSoup) -> Dict[str, Any]:
+    """Analyze structured data"""
+    return SchemaAnalyzer(soup).analyze()
+
+
+def analyze_content(url: str, soup: BeautifulSoup) -> Dict[str, Any]:
+    """Analyze content quality"""
+    return ContentQualityAnalyzer(soup).analyze()
+
+
+# Result key -> analyzer function, in reporting order
+ANALYZERS: Dict[str, Callable[[str, BeautifulSoup], Dict[str, Any]]] = {
+    'meta': analyze_meta,
+    'headings': analyze_headings,
+    'images': analyze_images,
+    'url': analyze_url_structure,
+    'schema': analyze_schema,
+    'content': analyze_content,
+}
+
+# Analyzers whose result depends on the URL and not only on the page
+URL_DEPENDENT_ANALYZERS = frozenset({'meta', 'url'})
+
+# Per-analyzer results keyed on a hash of the HTML (plus the URL for the
+# analyzers that depend on it), so byte-identical pages served under
+# different URLs (CDN mirrors, parameter variants) skip the work. Each
+# process keeps its own cache.
+ANALYSIS_CACHE_TTL = 600
+_analysis_cache = TTLCache(maxsize=1024, ttl=ANALYSIS_CACHE_TTL)
+
+
+def run_analyzers(url: str, soup: BeautifulSoup, names: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Run analyzers on an already-parsed page.
+
+    Args:
+        url: URL of the page
+        soup: Parsed page shared by all analyzers (never modified)
+        names: Result keys of the analyzers to run (defaults to all)
+
+    Returns:
+        Mapping of result key to analyzer result
+    """
+    names = ANALYZERS if names is None else names
+    return {name: ANALYZERS[name](url, soup) for name in names}
+
+
+async def run_analyzers_async(url: str, soup: BeautifulSoup, names: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Run analyzers on the default thread pool, off the event loop.
+
+    The analyzers only read the shared tree, so no locking is needed.
+
+    Args:
+        url: URL of the page
+        soup: Parsed page shared by all analyzers (never modified)
+        names: Result keys of the analyzers to run (defaults to all)
+
+    Returns:
+        Mapping of result key to analyzer result
+    """
+    names = list(ANALYZERS if names is None else names)
+    results = await asyncio.gather(
+        *(asyncio.to_thread(ANALYZERS[name], url, soup) for name in names)
+    )
+    return dict(zip(names, results))
+
+
+def _html_digest(html_content: str) -> bytes:
+    """Hash of the page HTML used in every cache key"""
+    return hashlib.blake2b(html_content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _cache_keys(url: str, html_content: str, names: Optional[Iterable[str]] = None) -> Dict[str, tuple]:
+    """Build the analysis cache key of each requested analyzer (defaults to all) for a page"""
+    digest = _html_digest(html_content)
+    return {
+        name: (name, digest, url) if name in URL_DEPENDENT_ANALYZERS else (name, digest)
+        for name in (ANALYZERS if names is None else names)
+    }
+
+
+def _lookup_cached(keys: Dict[str, tuple]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Fetch cached results for each key (None on a miss)"""
+    return {name: _analysis_cache.get(key) for name, key in keys.items()}
+
+
+def _store_and_copy(keys: Dict[str, tuple], results: Dict[str, Optional[Dict[str, Any]]],
+                    computed: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Cache freshly computed results and return copies of every result"""
+    for name, result in computed.items():
+        _analysis_cache.set(keys[name], result)
+        results[name] = result
+    # Callers replace top-level fields (e.g. issues), so never hand out the cached dicts
+    return {name: dict(result) for name, result in results.items()}
+
+
+def analyze_page(url: str, html_content: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Run every analyzer on a page, reusing cached results for identical HTML.
+
+    The page is only parsed when at least one analyzer misses the cache.
+
+    Args:
+        url: URL of the page
+        html_content: HTML string
+
+    Returns:
+        Mapping of result key to analyzer result
+    """
+    keys = _cache_keys(url, html_content)
+    results = _lookup_cached(keys)
+    missing = [name for name, result in results.items() if result is None]
+
+    computed = run_analyzers(url, parse_html(html_content), missing) if missing else {}
+    return _store_and_copy(keys, results, computed)
+
+
+async def analyze_page_async(url: str, html_content: str, names: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Async variant of analyze_page; hashing, parsing and analysis run off the event loop.
+
+    Args:
+        url: URL of the page
+        html_content: HTML string
+        names: Result keys of the analyzers to run (defaults to all)
+
+    Returns:
+        Mapping of result key to analyzer result
+    """
+    keys = await asyncio.to_thread(_cache_keys, url, html_content, names)
+    results = _lookup_cached(keys)
+    missing = [name for name, result in results.items() if result is None]
+
+    computed = {}
+    if missing:
+        soup = await asyncio.to_thread(parse_html, html_content)
+        computed = await run_analyzers_async(url, soup, missing)
+    return _store_and_copy(keys, results, computed)
+
+
+def extract_page(html_content: str, include_html: bool = True) -> Dict[str, Any]:
+    """
+    Extract structured content from a page, reusing the cached result for identical HTML.
+
+    Args:
+        html_content: HTML string
+        include_html: Keep the serialized markup of the content and its elements
+
+    Returns:
+        Extracted content (see app.scraper.extractor.extract_content)
+    """
+    key = ('extract', _html_digest(html_content), include_html)
+    content = _analysis_cache.get(key)
+    if content is None:
+        content = extract_content(html_content, include_html)
+        _analysis_cache.set(key, content)
+    return dict(content)
+
+
+async def extract_page_async(html_content: str, include_html: bool = True) -> Dict[str, Any]:
+    """
+    Async variant of extract_page; hashing and extraction run off the event loop.
+
+    Args:
+        html_content: HTML string
+        include_html: Keep the serialized markup of the content and its elements
+
+    Returns:
+        Extracted content (see app.scraper.extractor.extract_content)
+    """
+    return await asyncio.to_thread(extract_page, html_content, include_html)
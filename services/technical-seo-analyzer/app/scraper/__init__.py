@@ -8,11 +8,14 @@ Optimized for WordPress and modern JS-rendered websites.
 from .renderer import (
     get_rendered_html,
     get_rendered_html_async,
+    warmup,
+    is_ready,
     cleanup
 )
 
 from .extractor import (
     extract_content,
+    extract_content_batch,
     extract_full_text,
     ContentExtractor
 )
@@ -38,10 +41,13 @@ __all__ = [
     # Renderer
     'get_rendered_html',
     'get_rendered_html_async',
+    'warmup',
+    'is_ready',
     'cleanup',
     
     # Extractor
     'extract_content',
+    'extract_content_batch',
     'extract_full_text',
     'ContentExtractor',
     
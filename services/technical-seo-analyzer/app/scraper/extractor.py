@@ -10,11 +10,14 @@ Key features:
 """
 
 import re
+import sys
+import bisect
 import json
 import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
 from typing import Dict, List, Any, Optional, Set, Tuple
-from bs4 import BeautifulSoup, Tag, NavigableString, Comment
-from .helpers import clean_text, normalize_whitespace, dedupe
+from bs4 import BeautifulSoup, Tag, NavigableString, Comment, CData
+from .helpers import clean_text, normalize_whitespace
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +51,43 @@ CONTENT_SELECTORS = [
     '.blog-post',
 ]
 
+# Simple selector forms accepted in CONTENT_SELECTORS: tag, .class, #id, [attr="value"]
+SIMPLE_SELECTOR_RE = re.compile(r'^(?:(\w+)|\.([\w-]+)|#([\w-]+)|\[([\w-]+)="([^"]*)"\])$')
+
+
+def _index_content_selectors(selectors: List[str]) -> Dict[Tuple[str, str], int]:
+    """Map (kind, value) of each simple selector to its priority (index)."""
+    index = {}
+    for priority, selector in enumerate(selectors):
+        match = SIMPLE_SELECTOR_RE.match(selector)
+        if not match:
+            raise ValueError(f"Unsupported content selector: {selector}")
+        tag, class_name, element_id, attr, value = match.groups()
+        if tag:
+            key = ('tag', tag)
+        elif class_name:
+            key = ('class', class_name)
+        elif element_id:
+            key = ('id', element_id)
+        else:
+            key = (attr, value)
+        index.setdefault(key, priority)
+    return index
+
+
+# (kind, value) -> priority, so candidates are ranked in one traversal
+CONTENT_SELECTOR_PRIORITY = _index_content_selectors(CONTENT_SELECTORS)
+CONTENT_SELECTOR_ATTRS = {kind for kind, _ in CONTENT_SELECTOR_PRIORITY} - {'tag', 'class', 'id'}
+
+# Tags removed from the tree before the structured extraction
+STRIPPED_TAGS: Set[str] = {'script', 'style', 'noscript'}
+
+# Tags that are always noise, whatever their attributes
+NOISE_TAGS: Set[str] = {'nav', 'footer', 'aside'}
+
+# ARIA landmark roles that mark navigation/sidebar noise
+NOISE_ROLES: Set[str] = {'navigation', 'banner', 'contentinfo', 'complementary'}
+
 # Noise patterns - elements to skip
 NOISE_PATTERNS = [
     r'^nav$', r'^menu', r'^sidebar', r'^widget', r'^footer$', r'^header$',
@@ -55,28 +95,104 @@ NOISE_PATTERNS = [
     r'^ad-', r'^ads', r'cookie', r'popup', r'modal', r'overlay',
 ]
 
+# NOISE_PATTERNS are plain tokens tested against "<classes> <id>"; split by
+# anchoring into whole-string, prefix and substring checks
+NOISE_EXACT = frozenset(p[1:-1] for p in NOISE_PATTERNS if p.startswith('^') and p.endswith('$'))
+NOISE_PREFIXES = tuple(p[1:] for p in NOISE_PATTERNS if p.startswith('^') and not p.endswith('$'))
+NOISE_SUBSTRINGS = tuple(p for p in NOISE_PATTERNS if not p.startswith('^'))
+
+# Gutenberg block delimiters (comment text): block type and optional JSON
+# attrs on the opening comment, block type on the closing one
+GUTENBERG_OPEN_RE = re.compile(r'\s*wp:(\w+)(?:\s+({[^>]*}))?\s*$')
+GUTENBERG_CLOSE_RE = re.compile(r'\s*/wp:(\w+)\s*$')
+
+# String types get_text() returns (comments, script and style text excluded)
+GET_TEXT_STRING_TYPES = (NavigableString, CData)
+
+# A JSON-LD key extract_from_json_ld reads, as it appears in the raw payload
+JSON_LD_TEXT_KEY_RE = re.compile(r'"(?:articleBody|text|description)"')
+
+# Common data attributes that might contain content (in reporting order)
+DATA_CONTENT_ATTRS_ORDER = ('data-content', 'data-text', 'data-caption', 'data-title', 'data-description')
+DATA_CONTENT_ATTRS = frozenset(DATA_CONTENT_ATTRS_ORDER)
+
+# Below this many words extract_content retries the text with noise included
+MIN_CONTENT_WORDS = 100
+
+# Sentence terminators (end of a sentence when followed by whitespace or end of text)
+SENTENCE_END_RE = re.compile(r'[.!?]+(?:\s|$)')
+
+# Tags followed by a line break in walk_text_nodes output
+TEXT_BLOCK_TAGS: Set[str] = {
+    'p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'li', 'tr', 'blockquote', 'section', 'article',
+}
+
+# Heading tag name -> level
+HEADING_LEVELS: Dict[str, int] = {f'h{level}': level for level in range(1, 7)}
+
+# Tag name -> bucket filled by the single structural pass in _collect_tags
+TAG_BUCKETS: Dict[str, str] = {
+    **dict.fromkeys(HEADING_LEVELS, 'headings'),
+    'p': 'p',
+    'div': 'div',
+    'ul': 'lists',
+    'ol': 'lists',
+    'table': 'tables',
+    'blockquote': 'blockquotes',
+    'strong': 'strong',
+    'b': 'strong',
+    'em': 'em',
+    'i': 'em',
+}
+
+# Tags reported in elements_in_order
+ORDERED_TAGS: Set[str] = {
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'ul', 'ol', 'blockquote', 'table',
+}
+
+# List tags, and the parents that make a list nested (reported with its parent)
+LIST_TAGS: Set[str] = {'ul', 'ol'}
+LIST_PARENT_TAGS: Set[str] = {'li', 'ul', 'ol'}
+
+# Table parts read by _extract_tables
+ROW_TAGS: Set[str] = {'tr'}
+CELL_TAGS: Set[str] = {'td', 'th'}
+HEADER_CELL_TAGS: Set[str] = {'th'}
+
+# A div containing any of these is a container, not a paragraph
+DIV_BLOCK_TAGS: Set[str] = {'p', 'div', 'ul', 'ol', 'table', 'article', 'section'}
+
+# Parents whose elements_in_order candidates are already covered by the parent
+ORDERED_PARENT_TAGS: Set[str] = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'blockquote'}
+
 
 def _is_noise_element(tag: Tag) -> bool:
     """Check if element is navigation/sidebar noise."""
     if not isinstance(tag, Tag):
         return False
     
-    if tag.name in {'nav', 'footer', 'aside'}:
+    if tag.name in NOISE_TAGS:
         return True
     
-    classes = ' '.join(tag.get('class', []))
-    element_id = tag.get('id', '')
-    combined = f"{classes} {element_id}".lower()
-    
-    for pattern in NOISE_PATTERNS:
-        if re.search(pattern, combined):
-            return True
-    
+    # Cheap role lookup before building the class/id string for the regex
     role = tag.get('role', '').lower()
-    if role in {'navigation', 'banner', 'contentinfo', 'complementary'}:
+    if role in NOISE_ROLES:
         return True
     
-    return False
+    class_list = tag.get('class')
+    element_id = tag.get('id')
+    if not class_list and not element_id:
+        return False
+    
+    # One string so that the anchored patterns only see the first class
+    combined = f"{' '.join(class_list or ())} {element_id or ''}".lower()
+    
+    return (
+        combined in NOISE_EXACT
+        or combined.startswith(NOISE_PREFIXES)
+        or any(token in combined for token in NOISE_SUBSTRINGS)
+    )
 
 
 def _is_hidden(tag: Tag) -> bool:
@@ -84,17 +200,18 @@ def _is_hidden(tag: Tag) -> bool:
     if not isinstance(tag, Tag):
         return False
     
-    style = tag.get('style', '').lower()
-    if 'display:none' in style.replace(' ', '') or 'visibility:hidden' in style.replace(' ', ''):
-        return True
-    
     if tag.has_attr('hidden') or tag.get('aria-hidden') == 'true':
         return True
     
+    style = tag.get('style')
+    if style:
+        style = style.replace(' ', '').lower()
+        return 'display:none' in style or 'visibility:hidden' in style
+    
     return False
 
 
-def extract_gutenberg_content(html: str) -> str:
+def extract_gutenberg_content(soup: BeautifulSoup) -> str:
     """
     Extract content from Gutenberg block comments.
     
@@ -104,20 +221,45 @@ def extract_gutenberg_content(html: str) -> str:
     <!-- /wp:paragraph -->
     
     Some blocks also store JSON data in comments.
+    
+    Works on the parsed tree: a block is the text between an opening comment
+    and the next closing comment of the same type. As with a regex scan of
+    the raw HTML, blocks nested inside a matched block are not reported again.
     """
     texts = []
     
-    # Find all Gutenberg block comments
-    block_pattern = r'<!--\s*wp:(\w+)(?:\s+({[^>]*}))?\s*-->(.*?)<!--\s*/wp:\1\s*-->'
-    
-    for match in re.finditer(block_pattern, html, re.DOTALL):
+    # Document order; comments are the block delimiters
+    nodes = list(soup.descendants)
+    closes: Dict[str, List[int]] = {}
+    opens = []
+    for index, node in enumerate(nodes):
+        if type(node) is Comment:
+            match = GUTENBERG_CLOSE_RE.match(node)
+            if match:
+                closes.setdefault(match.group(1), []).append(index)
+            else:
+                match = GUTENBERG_OPEN_RE.match(node)
+                if match:
+                    opens.append((index, match))
+    
+    end = -1
+    for index, match in opens:
+        if index < end:
+            continue
         block_type = match.group(1)
         block_attrs = match.group(2)
-        block_content = match.group(3)
+        positions = closes.get(block_type, ())
+        close = bisect.bisect_right(positions, index)
+        if close == len(positions):
+            continue
+        end = positions[close]
         
-        # Extract text from block content
-        soup = BeautifulSoup(block_content, 'lxml')
-        text = soup.get_text(separator=' ', strip=True)
+        # Extract text from block content (strings get_text() would return)
+        text = ' '.join(
+            stripped for stripped in (
+                node.strip() for node in nodes[index + 1:end] if type(node) in GET_TEXT_STRING_TYPES
+            ) if stripped
+        )
         if text:
             texts.append(text)
         
@@ -141,12 +283,15 @@ def extract_from_data_attributes(soup: BeautifulSoup) -> str:
     """Extract text from data attributes that might contain content."""
     texts = []
     
-    # Common data attributes that might contain content
-    data_attrs = ['data-content', 'data-text', 'data-caption', 'data-title', 'data-description']
+    # Gather every attribute in one walk; values are reported grouped by attribute
+    values: Dict[str, List[str]] = {attr: [] for attr in DATA_CONTENT_ATTRS}
+    for element in soup.descendants:
+        if isinstance(element, Tag) and element.attrs:
+            for attr in DATA_CONTENT_ATTRS.intersection(element.attrs):
+                values[attr].append(element.attrs[attr])
     
-    for attr in data_attrs:
-        for element in soup.find_all(attrs={attr: True}):
-            value = element.get(attr, '')
+    for attr in DATA_CONTENT_ATTRS_ORDER:
+        for value in values[attr]:
             if value and len(value) > 10:
                 # Check if it's HTML
                 if '<' in value:
@@ -166,8 +311,12 @@ def extract_from_json_ld(soup: BeautifulSoup) -> str:
     texts = []
     
     for script in soup.find_all('script', type='application/ld+json'):
+        # Only decode payloads that can hold one of the keys read below
+        raw = script.string
+        if not raw or not JSON_LD_TEXT_KEY_RE.search(raw):
+            continue
         try:
-            data = json.loads(script.string)
+            data = json.loads(raw)
             
             # Handle both single object and array
             items = data if isinstance(data, list) else [data]
@@ -191,21 +340,27 @@ def walk_text_nodes(element, skip_noise: bool = True) -> List[str]:
     """
     Walk through all text nodes in an element.
     This is the most thorough extraction method.
+    
+    Iterative (explicit stack of child iterators), so deeply nested pages
+    cannot hit the recursion limit.
     """
     texts = []
+    if element is None:
+        return texts
     
-    def walk(node):
-        if node is None:
-            return
-        
-        for child in node.children:
+    # (remaining children, tag whose children they are)
+    stack = [(iter(element.children), None)]
+    
+    while stack:
+        children, parent = stack[-1]
+        for child in children:
             if isinstance(child, NavigableString):
                 # Skip comments but don't remove them
                 if isinstance(child, Comment):
                     continue
                 
-                text = str(child).strip()
-                if text and len(text) > 1:
+                text = child.strip()
+                if len(text) > 1:
                     texts.append(text)
                     
             elif isinstance(child, Tag):
@@ -213,63 +368,84 @@ def walk_text_nodes(element, skip_noise: bool = True) -> List[str]:
                 if child.name in SKIP_TAGS:
                     continue
                 
-                # Skip hidden elements
-                if _is_hidden(child):
-                    continue
+                if child.attrs:
+                    # Skip hidden elements
+                    if _is_hidden(child):
+                        continue
+                    
+                    # Optionally skip noise
+                    if skip_noise and _is_noise_element(child):
+                        continue
                 
-                # Optionally skip noise
-                if skip_noise and _is_noise_element(child):
+                # Without attributes only the tag name can mark it hidden or noise
+                elif skip_noise and child.name in NOISE_TAGS:
                     continue
                 
-                # Recurse
-                walk(child)
-                
-                # Add spacing after block elements
-                if child.name in {'p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 
-                                  'li', 'tr', 'blockquote', 'section', 'article'}:
-                    if texts and texts[-1] != '\n':
-                        texts.append('\n')
+                # Descend; the rest of this level resumes once child is done
+                stack.append((iter(child.children), child))
+                break
+        else:
+            stack.pop()
+            
+            # Add spacing after block elements
+            if parent is not None and parent.name in TEXT_BLOCK_TAGS:
+                if texts and texts[-1] != '\n':
+                    texts.append('\n')
     
-    walk(element)
     return texts
 
 
-def extract_full_text(html: str, include_noise: bool = False) -> str:
+def _find_main_content(soup: BeautifulSoup) -> Optional[Tag]:
     """
-    Extract ALL visible text from HTML using multiple strategies.
-    
-    Strategies (in order):
-    1. Direct text node walking
-    2. Gutenberg block extraction
-    3. Data attribute extraction
-    4. JSON-LD extraction
+    Return the first element matching CONTENT_SELECTORS (priority order), if any.
     
-    Returns the longest/most complete result.
+    Same result as calling select_one per selector, but the tree is walked
+    once: the first element (document order) of the best priority wins.
     """
-    if not html:
-        return ''
+    priorities = CONTENT_SELECTOR_PRIORITY
+    best = None
+    best_priority = len(CONTENT_SELECTORS)
     
-    soup = BeautifulSoup(html, 'lxml')
-    results = []
-    
-    # Strategy 1: Find main content and walk text nodes
-    main_content = None
-    for selector in CONTENT_SELECTORS:
-        candidate = soup.select_one(selector)
-        if candidate:
-            main_content = candidate
-            break
+    for node in soup.descendants:
+        if not isinstance(node, Tag):
+            continue
+        
+        priority = priorities.get(('tag', node.name), best_priority)
+        for class_name in node.get('class') or ():
+            priority = min(priority, priorities.get(('class', class_name), best_priority))
+        element_id = node.get('id')
+        if element_id:
+            priority = min(priority, priorities.get(('id', element_id), best_priority))
+        for attr in CONTENT_SELECTOR_ATTRS:
+            value = node.get(attr)
+            if value:
+                priority = min(priority, priorities.get((attr, value), best_priority))
+        
+        if priority < best_priority:
+            best, best_priority = node, priority
+            if priority == 0:
+                break
     
-    # Use body if no main content found
-    search_area = main_content or soup.body or soup
+    if best is not None:
+        logger.debug(f"Using content selector: {CONTENT_SELECTORS[best_priority]}")
+    return best
+
+
+def _dom_walk_text(search_area, include_noise: bool) -> str:
+    """Strategy 1: walk the text nodes of the content area."""
+    return normalize_whitespace(' '.join(walk_text_nodes(search_area, skip_noise=not include_noise)))
+
+
+def _fallback_strategies(soup: BeautifulSoup) -> List[Tuple[str, str]]:
+    """
+    Strategies 2-5, which do not depend on the noise setting.
     
-    # Walk text nodes
-    text_nodes = walk_text_nodes(search_area, skip_noise=not include_noise)
-    strategy1_text = normalize_whitespace(' '.join(text_nodes))
-    results.append(('DOM walk', strategy1_text))
+    Needs the unmodified tree (the JSON-LD strategy reads script tags).
+    """
+    results = []
     
     # Strategy 2: Gutenberg blocks
-    gutenberg_text = extract_gutenberg_content(html)
+    gutenberg_text = extract_gutenberg_content(soup)
     if gutenberg_text:
         results.append(('Gutenberg', gutenberg_text))
     
@@ -289,7 +465,24 @@ def extract_full_text(html: str, include_noise: bool = False) -> str:
         fallback_text = normalize_whitespace(' '.join(all_text_nodes))
         results.append(('Full body', fallback_text))
     
-    # Choose best result (longest with reasonable structure)
+    return results
+
+
+def _text_strategies(search_area, soup: BeautifulSoup, include_noise: bool,
+                     fallbacks: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """
+    Strategy 1 followed by the fallbacks.
+    
+    With noise included a walk of <body> is exactly the 'Full body' fallback,
+    so it is not repeated.
+    """
+    if include_noise and search_area is soup.body:
+        return fallbacks
+    return [('DOM walk', _dom_walk_text(search_area, include_noise))] + fallbacks
+
+
+def _best_text(results: List[Tuple[str, str]]) -> Tuple[str, int]:
+    """Choose best result (longest with reasonable structure); returns (text, word count)."""
     best_text = ''
     best_word_count = 0
     best_strategy = ''
@@ -305,13 +498,46 @@ def extract_full_text(html: str, include_noise: bool = False) -> str:
     
     logger.info(f"Best extraction: '{best_strategy}' with {best_word_count} words")
     
-    return best_text
+    return best_text, best_word_count
+
+
+def extract_full_text(html: str, include_noise: bool = False) -> str:
+    """
+    Extract ALL visible text from HTML using multiple strategies.
+    
+    Strategies (in order):
+    1. Direct text node walking
+    2. Gutenberg block extraction
+    3. Data attribute extraction
+    4. JSON-LD extraction
+    
+    Returns the longest/most complete result.
+    """
+    if not html:
+        return ''
+    
+    soup = BeautifulSoup(html, 'lxml')
+    
+    # Strategy 1: Find main content and walk text nodes (body if no main content found)
+    search_area = _find_main_content(soup) or soup.body or soup
+    results = _text_strategies(search_area, soup, include_noise, _fallback_strategies(soup))
+    
+    return _best_text(results)[0]
 
 
-def extract_content(html: str) -> Dict[str, Any]:
+def extract_content(html: str, include_html: bool = True) -> Dict[str, Any]:
     """
     Extract structured content from HTML.
     
+    The page is parsed once; the full-text strategies and the structured
+    extraction share the tree.
+    
+    Args:
+        html: Raw HTML string
+        include_html: Keep the serialized 'html' markup of the content area
+            and of every extracted element; callers that only need the text
+            can skip serializing it
+    
     Returns:
         Dictionary with headings, paragraphs, lists, tables, full_text, etc.
     """
@@ -320,43 +546,50 @@ def extract_content(html: str) -> Dict[str, Any]:
     
     soup = BeautifulSoup(html, 'lxml')
     
-    # Remove only script/style (keep comments for Gutenberg)
-    for tag in soup.find_all(['script', 'style', 'noscript']):
-        tag.decompose()
-    
     # Find main content
-    main_content = None
-    for selector in CONTENT_SELECTORS:
-        candidate = soup.select_one(selector)
-        if candidate:
-            main_content = candidate
-            logger.debug(f"Using content selector: {selector}")
-            break
-    
-    search_area = main_content or soup.body or soup
+    search_area = _find_main_content(soup) or soup.body or soup
+    in_stripped = any(parent.name in STRIPPED_TAGS for parent in search_area.parents)
     
-    # Extract full text using best strategy
-    full_text = extract_full_text(html, include_noise=False)
+    # Extract full text using best strategy (before scripts are removed:
+    # the JSON-LD strategy reads them)
+    fallbacks = _fallback_strategies(soup)
+    full_text, word_count = _best_text(_text_strategies(search_area, soup, False, fallbacks))
     
     # If text is too short, try with noise included
-    if len(full_text.split()) < 100:
+    if word_count < MIN_CONTENT_WORDS:
         logger.warning("Content too short, trying with noise included")
-        full_text_with_noise = extract_full_text(html, include_noise=True)
-        if len(full_text_with_noise.split()) > len(full_text.split()) * 1.5:
-            full_text = full_text_with_noise
-    
-    # Extract structured elements
-    headings = _extract_headings(search_area)
-    paragraphs = _extract_paragraphs(search_area)
-    lists = _extract_lists(search_area)
-    tables = _extract_tables(search_area)
-    blockquotes = _extract_blockquotes(search_area)
-    elements_in_order = _extract_elements_in_order(search_area)
-    
-    # Calculate stats
-    word_count = len(full_text.split())
+        text_with_noise, word_count_with_noise = _best_text(
+            _text_strategies(search_area, soup, True, fallbacks)
+        )
+        if word_count_with_noise > word_count * 1.5:
+            full_text, word_count = text_with_noise, word_count_with_noise
+    
+    # Remove only script/style (keep comments for Gutenberg); collected first,
+    # the tree cannot change while it is walked
+    for tag in [node for node in soup.descendants
+                if isinstance(node, Tag) and node.name in STRIPPED_TAGS]:
+        tag.decompose()
+    
+    # A content match inside <noscript> (etc.) was just removed; pick the
+    # container again from what is left, as a selection on the stripped tree would
+    if in_stripped:
+        search_area = _find_main_content(soup) or soup.body or soup
+    
+    # Extract structured elements from a single traversal of the content area
+    buckets = _collect_tags(search_area)
+    cache = _TagCache(include_html)
+    headings = _extract_headings(buckets['headings'], cache)
+    paragraphs = _extract_paragraphs(buckets['p'], buckets['div'], cache)
+    lists = _extract_lists(buckets['lists'], cache)
+    tables = _extract_tables(buckets['tables'], cache)
+    blockquotes = _extract_blockquotes(buckets['blockquotes'], cache)
+    elements_in_order = _extract_elements_in_order(buckets['ordered'], cache)
+    
+    # Calculate stats (word_count comes from the strategy selection)
     char_count = len(full_text)
-    sentence_count = len(re.findall(r'[.!?]+(?:\s|$)', full_text))
+    sentence_count = len(SENTENCE_END_RE.findall(full_text))
+    
+    title, meta_description = _extract_head_metadata(soup)
     
     result = {
         'headings': headings,
@@ -364,13 +597,13 @@ def extract_content(html: str) -> Dict[str, Any]:
         'lists': lists,
         'tables': tables,
         'blockquotes': blockquotes,
-        'emphasis': _extract_emphasis(search_area),
+        'emphasis': _extract_emphasis(buckets['strong'], buckets['em'], cache),
         'full_text': full_text,
-        'html': str(search_area),
+        **({'html': str(search_area)} if include_html else {}),
         'elements_in_order': elements_in_order,
         'metadata': {
-            'title': _extract_title(soup),
-            'meta_description': _extract_meta_description(soup),
+            'title': title,
+            'meta_description': meta_description,
             'word_count': word_count,
             'character_count': char_count,
             'sentence_count': sentence_count,
@@ -383,6 +616,40 @@ def extract_content(html: str) -> Dict[str, Any]:
     return result
 
 
+def extract_content_batch(
+    htmls: List[str],
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    chunksize: int = 4
+) -> List[Dict[str, Any]]:
+    """
+    Extract structured content from many pages in parallel.
+    
+    Extraction is CPU-bound Python work that holds the GIL, so pages are
+    spread over processes rather than threads. Throughput scales roughly
+    with the number of cores; going past os.cpu_count() workers only adds
+    process and pickling overhead.
+    
+    Args:
+        htmls: HTML strings to extract
+        workers: Size of the process pool created for this call
+                 (defaults to os.cpu_count(); ignored when executor is given)
+        executor: Existing executor to reuse across calls
+        chunksize: Pages sent to a worker per task
+        
+    Returns:
+        One extract_content result per page, in input order
+    """
+    if not htmls:
+        return []
+    
+    if executor is not None:
+        return list(executor.map(extract_content, htmls, chunksize=chunksize))
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(extract_content, htmls, chunksize=chunksize))
+
+
 def _empty_result() -> Dict[str, Any]:
     """Return empty result structure."""
     return {
@@ -405,183 +672,311 @@ def _empty_result() -> Dict[str, Any]:
     }
 
 
-def _extract_headings(soup) -> List[Dict[str, Any]]:
+def _collect_tags(search_area) -> Dict[str, List[Tag]]:
+    """
+    Group the structural tags below search_area by bucket in one traversal.
+    
+    Every bucket (see TAG_BUCKETS) keeps document order, as separate
+    find_all calls would; 'ordered' holds the elements_in_order candidates.
+    """
+    buckets: Dict[str, List[Tag]] = {name: [] for name in set(TAG_BUCKETS.values())}
+    buckets['ordered'] = []
+    ordered = buckets['ordered']
+    
+    for node in search_area.descendants:
+        if not isinstance(node, Tag):
+            continue
+        bucket = TAG_BUCKETS.get(node.name)
+        if bucket is not None:
+            buckets[bucket].append(node)
+            if node.name in ORDERED_TAGS:
+                ordered.append(node)
+    
+    return buckets
+
+
+# Strings up to this length are interned: short cells, list items and their
+# markup repeat a lot, and extraction results are kept in the analysis cache
+INTERN_MAX_LENGTH = 64
+
+
+def _intern_short(value: str) -> str:
+    """Return the shared copy of short strings, value itself otherwise."""
+    return sys.intern(value) if len(value) <= INTERN_MAX_LENGTH else value
+
+
+class _TagCache:
+    """
+    Per-extraction memo of clean tag text and serialized markup.
+    
+    Headings, paragraphs, lists and blockquotes are also visited by
+    _extract_elements_in_order, so their text and html are computed once.
+    Keyed by id(), which is stable while the tree is alive. Different tags
+    with the same short text or markup share one string. With include_html
+    off, markup() yields no 'html' field and nothing is serialized.
+    """
+    
+    __slots__ = ('_texts', '_htmls', 'include_html')
+    
+    def __init__(self, include_html: bool = True):
+        self._texts: Dict[int, str] = {}
+        self._htmls: Dict[int, str] = {}
+        self.include_html = include_html
+    
+    def text(self, tag: Tag) -> str:
+        """clean_text(tag.get_text()), memoized"""
+        key = id(tag)
+        text = self._texts.get(key)
+        if text is None:
+            # A lone text node (.string) is the whole get_text() result,
+            # unless it is a comment or script/style text get_text() skips
+            string = tag.string
+            if type(string) not in GET_TEXT_STRING_TYPES:
+                string = tag.get_text()
+            text = self._texts[key] = _intern_short(clean_text(string))
+        return text
+    
+    def html(self, tag: Tag) -> str:
+        """str(tag), memoized"""
+        key = id(tag)
+        markup = self._htmls.get(key)
+        if markup is None:
+            markup = self._htmls[key] = _intern_short(str(tag))
+        return markup
+    
+    def markup(self, tag: Tag) -> Dict[str, str]:
+        """The {'html': ...} field of a result item, or {} when markup is not wanted"""
+        return {'html': self.html(tag)} if self.include_html else {}
+
+
+def _extract_headings(tags: List[Tag], cache: _TagCache) -> List[Dict[str, Any]]:
     """Extract all headings in order."""
     headings = []
-    for tag in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-        text = clean_text(tag.get_text())
+    for tag in tags:
+        text = cache.text(tag)
         if text and len(text) > 1:
             headings.append({
-                'level': int(tag.name[1]),
+                'level': HEADING_LEVELS[tag.name],
                 'tag': tag.name,
                 'text': text,
                 'id': tag.get('id', ''),
-                'html': str(tag)
+                **cache.markup(tag)
             })
     return headings
 
 
-def _extract_paragraphs(soup) -> List[Dict[str, Any]]:
+def _extract_paragraphs(p_tags: List[Tag], div_tags: List[Tag], cache: _TagCache) -> List[Dict[str, Any]]:
     """Extract all paragraphs and paragraph-like content."""
     paragraphs = []
     seen_texts = set()
     
     # Get <p> tags
-    for p in soup.find_all('p'):
-        text = clean_text(p.get_text())
+    for p in p_tags:
+        text = cache.text(p)
         if text and len(text) > 10 and text not in seen_texts:
             seen_texts.add(text)
             paragraphs.append({
                 'text': text,
-                'html': str(p),
+                **cache.markup(p),
                 'word_count': len(text.split())
             })
     
     # Also check divs that look like paragraphs (no block children)
-    for div in soup.find_all('div'):
-        if div.find(['p', 'div', 'ul', 'ol', 'table', 'article', 'section']):
+    for div in div_tags:
+        if any(isinstance(node, Tag) and node.name in DIV_BLOCK_TAGS for node in div.descendants):
             continue
         
-        text = clean_text(div.get_text())
+        text = cache.text(div)
         if text and len(text) > 30 and text not in seen_texts:
             seen_texts.add(text)
             paragraphs.append({
                 'text': text,
-                'html': str(div),
+                **cache.markup(div),
                 'word_count': len(text.split())
             })
     
     return paragraphs
 
 
-def _extract_lists(soup) -> List[Dict[str, Any]]:
+def _list_items(list_tag: Tag) -> List[Tag]:
+    """Direct <li> children of a list (find_all('li', recursive=False) without the filter machinery)."""
+    return [child for child in list_tag.contents if isinstance(child, Tag) and child.name == 'li']
+
+
+def _extract_lists(list_tags: List[Tag], cache: _TagCache) -> List[Dict[str, Any]]:
     """Extract lists."""
     lists = []
-    for list_tag in soup.find_all(['ul', 'ol']):
-        if list_tag.parent and list_tag.parent.name in ['li', 'ul', 'ol']:
+    for list_tag in list_tags:
+        if list_tag.parent and list_tag.parent.name in LIST_PARENT_TAGS:
             continue
         
         items = []
-        for li in list_tag.find_all('li', recursive=False):
-            text = clean_text(li.get_text())
+        for li in _list_items(list_tag):
+            text = cache.text(li)
             if text:
-                items.append({'text': text, 'html': str(li)})
+                items.append({'text': text, **cache.markup(li)})
         
         if items:
             lists.append({
                 'type': 'ordered' if list_tag.name == 'ol' else 'unordered',
                 'tag': list_tag.name,
                 'items': items,
-                'html': str(list_tag)
+                **cache.markup(list_tag)
             })
     
     return lists
 
 
-def _extract_tables(soup) -> List[Dict[str, Any]]:
+def _descendant_tags(tag: Tag, names: Set[str]) -> List[Tag]:
+    """tag.find_all(names) as a plain descendants scan (bs4's name-list matcher is slow)."""
+    return [node for node in tag.descendants if isinstance(node, Tag) and node.name in names]
+
+
+def _extract_tables(table_tags: List[Tag], cache: _TagCache) -> List[Dict[str, Any]]:
     """Extract tables."""
     tables = []
-    for table in soup.find_all('table'):
+    for table in table_tags:
         headers = []
         rows = []
         
         thead = table.find('thead')
         if thead:
-            for th in thead.find_all('th'):
-                headers.append(clean_text(th.get_text()))
+            for th in _descendant_tags(thead, HEADER_CELL_TAGS):
+                headers.append(cache.text(th))
+        
+        # Without a thead, the first row is treated as the header row and skipped.
+        # Only that row: later rows repeating the header (long tables often
+        # repeat it) are kept, where an equality check used to drop them too
+        first_tr = None if headers else table.find('tr')
         
         tbody = table.find('tbody') or table
-        for tr in tbody.find_all('tr'):
-            row = [clean_text(td.get_text()) for td in tr.find_all(['td', 'th'])]
-            if row and not (not headers and tr == table.find('tr')):
+        for tr in _descendant_tags(tbody, ROW_TAGS):
+            if tr is first_tr:
+                continue
+            row = [cache.text(td) for td in _descendant_tags(tr, CELL_TAGS)]
+            if row:
                 rows.append(row)
         
         if headers or rows:
-            tables.append({'headers': headers, 'rows': rows, 'html': str(table)})
+            tables.append({'headers': headers, 'rows': rows, **cache.markup(table)})
     
     return tables
 
 
-def _extract_blockquotes(soup) -> List[Dict[str, Any]]:
+def _extract_blockquotes(blockquote_tags: List[Tag], cache: _TagCache) -> List[Dict[str, Any]]:
     """Extract blockquotes."""
     blockquotes = []
-    for bq in soup.find_all('blockquote'):
-        text = clean_text(bq.get_text())
+    for bq in blockquote_tags:
+        text = cache.text(bq)
         if text:
             cite = bq.find('cite')
             blockquotes.append({
                 'text': text,
-                'citation': clean_text(cite.get_text()) if cite else '',
-                'html': str(bq)
+                'citation': cache.text(cite) if cite else '',
+                **cache.markup(bq)
             })
     return blockquotes
 
 
-def _extract_emphasis(soup) -> Dict[str, List[str]]:
+def _extract_emphasis(strong_tags: List[Tag], em_tags: List[Tag], cache: _TagCache) -> Dict[str, List[str]]:
     """Extract emphasized text."""
-    strong = [clean_text(t.get_text()) for t in soup.find_all(['strong', 'b']) if clean_text(t.get_text())]
-    em = [clean_text(t.get_text()) for t in soup.find_all(['em', 'i']) if clean_text(t.get_text())]
-    return {'strong': dedupe(strong), 'em': dedupe(em)}
+    # dict keys dedupe while keeping first-seen order
+    strong = dict.fromkeys(text for text in (cache.text(t) for t in strong_tags) if text)
+    em = dict.fromkeys(text for text in (cache.text(t) for t in em_tags) if text)
+    return {'strong': list(strong), 'em': list(em)}
 
 
-def _extract_elements_in_order(soup) -> List[Dict[str, Any]]:
+def _extract_elements_in_order(tags: List[Tag], cache: _TagCache) -> List[Dict[str, Any]]:
     """Extract elements in DOM order."""
     elements = []
-    for tag in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'ul', 'ol', 'blockquote', 'table']):
-        if tag.parent and tag.parent.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'blockquote']:
+    for tag in tags:
+        if tag.parent and tag.parent.name in ORDERED_PARENT_TAGS:
             continue
         
-        text = clean_text(tag.get_text())
+        text = cache.text(tag)
         if not text or len(text) < 3:
             continue
         
-        elem_type = 'heading' if tag.name.startswith('h') else tag.name
-        if tag.name in ['ul', 'ol']:
+        level = HEADING_LEVELS.get(tag.name)
+        elem_type = 'heading' if level else tag.name
+        if tag.name in LIST_TAGS:
             elem_type = 'list'
         
-        item = {'type': elem_type, 'tag': tag.name, 'text': text, 'html': str(tag)}
+        item = {'type': elem_type, 'tag': tag.name, 'text': text, **cache.markup(tag)}
         
-        if elem_type == 'heading':
-            item['level'] = int(tag.name[1])
+        if level:
+            item['level'] = level
         elif elem_type == 'list':
             item['list_type'] = 'ordered' if tag.name == 'ol' else 'unordered'
-            item['items'] = [clean_text(li.get_text()) for li in tag.find_all('li', recursive=False)]
+            item['items'] = [cache.text(li) for li in _list_items(tag)]
         
         elements.append(item)
     
     return elements
 
 
-def _extract_title(soup) -> str:
-    """Extract page title."""
-    title = soup.find('title')
-    if title:
-        return clean_text(title.get_text())
-    h1 = soup.find('h1')
-    if h1:
-        return clean_text(h1.get_text())
-    return ''
-
-
-def _extract_meta_description(soup) -> str:
-    """Extract meta description."""
-    meta = soup.find('meta', attrs={'name': 'description'})
-    if meta:
-        return clean_text(meta.get('content', ''))
-    og = soup.find('meta', property='og:description')
-    if og:
-        return clean_text(og.get('content', ''))
-    return ''
+def _extract_head_metadata(soup) -> Tuple[str, str]:
+    """
+    Extract page title and meta description.
+    
+    The <head> children are scanned once; the full-tree find() is only used
+    for whatever the head does not provide (title falls back to the first
+    <h1>, description to og:description).
+    """
+    title = description = og_description = None
+    head = soup.head
+    for el in (head.children if head else ()):
+        if not isinstance(el, Tag):
+            continue
+        if el.name == 'title':
+            if title is None:
+                title = el
+        elif el.name == 'meta':
+            if description is None and el.get('name') == 'description':
+                description = el
+            elif og_description is None and el.get('property') == 'og:description':
+                og_description = el
+    
+    if title is None:
+        title = soup.find('title') or soup.find('h1')
+    if description is None:
+        description = soup.find('meta', attrs={'name': 'description'})
+    if description is None and og_description is None:
+        og_description = soup.find('meta', property='og:description')
+    
+    meta = description if description is not None else og_description
+    return (
+        clean_text(title.get_text()) if title else '',
+        clean_text(meta.get('content', '')) if meta else '',
+    )
 
 
 class ContentExtractor:
-    """Class-based interface for backwards compatibility."""
+    """
+    Class-based interface for backwards compatibility.
+    
+    Results are memoized on the instance, so calling extract() and then
+    extract_full_text() parses the page once.
+    """
     
     def __init__(self, html: str):
         self.html = html
+        self._content: Dict[bool, Dict[str, Any]] = {}
+        self._full_text: Optional[str] = None
     
-    def extract(self) -> Dict[str, Any]:
-        return extract_content(self.html)
+    def extract(self, include_html: bool = True) -> Dict[str, Any]:
+        content = self._content.get(include_html)
+        if content is None:
+            content = self._content[include_html] = extract_content(self.html, include_html)
+        return dict(content)
     
     def extract_full_text(self) -> str:
-        return extract_full_text(self.html)
+        if self._full_text is None:
+            # extract_content only departs from extract_full_text when it
+            # retried a short page with noise included
+            content = next(iter(self._content.values()), None)
+            if content is not None and content['metadata']['word_count'] >= MIN_CONTENT_WORDS:
+                self._full_text = content['full_text']
+            else:
+                self._full_text = extract_full_text(self.html)
+        return self._full_text
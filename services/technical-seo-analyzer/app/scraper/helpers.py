@@ -6,7 +6,7 @@ Includes text cleaning, URL manipulation, and data normalization.
 import re
 import unicodedata
 from typing import List, Optional, Any, TypeVar
-from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
+from urllib.parse import urlparse, urlunparse, urlsplit, urlunsplit, unquote_plus
 import html
 
 T = TypeVar('T')
@@ -34,6 +34,23 @@ TRACKING_PARAMS = [
     'trk', 'clickid', 'zanpid', 'irclickid',
 ]
 
+# Lowercased TRACKING_PARAMS, matched against decoded query keys
+_TRACKING_PARAM_KEYS = frozenset(param.lower() for param in TRACKING_PARAMS)
+
+
+# clean_text patterns; control characters are the Unicode Cc category
+# (C0, DEL and C1) minus tab, newline and carriage return
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]')
+_INLINE_WHITESPACE_RE = re.compile(r'[\t\r\f\v]+')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_SINGLE_NEWLINE_RE = re.compile(r'(?<!\n)\n(?!\n)')
+_SPACES_RE = re.compile(r' +')
+
+# normalize_whitespace patterns
+_TABS_RE = re.compile(r'[\t\r\f\v]+')
+_PARAGRAPH_BREAKS_RE = re.compile(r'\n\s*\n\s*\n+')
+_SPACE_RUNS_RE = re.compile(r'  +')
+
 
 def clean_text(text: Optional[str]) -> str:
     """
@@ -57,6 +74,11 @@ def clean_text(text: Optional[str]) -> str:
     # Convert to string
     text = str(text)
     
+    # Empty wrappers are common in CMS markup: whitespace-only text always
+    # cleans to '', so skip the passes below
+    if text.isspace():
+        return ''
+    
     # Decode HTML entities
     text = html.unescape(text)
     
@@ -64,22 +86,22 @@ def clean_text(text: Optional[str]) -> str:
     text = unicodedata.normalize('NFKC', text)
     
     # Remove control characters except newlines/tabs
-    text = ''.join(
-        char for char in text
-        if unicodedata.category(char) != 'Cc' or char in '\n\t\r'
-    )
+    text = _CONTROL_CHARS_RE.sub('', text)
     
     # Replace various whitespace characters with regular space
-    text = re.sub(r'[\t\r\f\v]+', ' ', text)
+    text = _INLINE_WHITESPACE_RE.sub(' ', text)
     
-    # Replace multiple newlines with double newline
-    text = re.sub(r'\n\s*\n', '\n\n', text)
-    
-    # Replace single newlines with space
-    text = re.sub(r'(?<!\n)\n(?!\n)', ' ', text)
+    # Most element texts are a single line: skip the newline passes then
+    if '\n' in text:
+        # Replace multiple newlines with double newline
+        text = _BLANK_LINES_RE.sub('\n\n', text)
+        
+        # Replace single newlines with space
+        text = _SINGLE_NEWLINE_RE.sub(' ', text)
     
     # Collapse multiple spaces
-    text = re.sub(r' +', ' ', text)
+    if '  ' in text:
+        text = _SPACES_RE.sub(' ', text)
     
     # Strip
     text = text.strip()
@@ -100,20 +122,20 @@ def normalize_whitespace(text: Optional[str]) -> str:
     if not text:
         return ''
     
-    # Replace various whitespace
-    text = re.sub(r'[\t\r\f\v]+', ' ', text)
+    # Replace various whitespace (most extracted text has none of these)
+    if '\t' in text or '\r' in text or '\f' in text or '\v' in text:
+        text = _TABS_RE.sub(' ', text)
     
     # Normalize multiple newlines to double (paragraph break)
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+    text = _PARAGRAPH_BREAKS_RE.sub('\n\n', text)
     
     # Replace single newlines with space (within paragraph)
     lines = text.split('\n\n')
     cleaned_lines = []
     for line in lines:
-        # Within each paragraph, collapse newlines to spaces
-        line = re.sub(r'\n', ' ', line)
-        # Collapse multiple spaces
-        line = re.sub(r' +', ' ', line)
+        # Within each paragraph, collapse newlines to spaces, then collapse
+        # runs of spaces (single spaces are left alone rather than rewritten)
+        line = _SPACE_RUNS_RE.sub(' ', line.replace('\n', ' '))
         line = line.strip()
         if line:
             cleaned_lines.append(line)
@@ -158,6 +180,14 @@ def dedupe(items: List[T]) -> List[T]:
     return result
 
 
+def _is_tracking_param(param: str) -> bool:
+    """Whether a 'key=value' query piece has a tracking key (percent-encoded keys are decoded first)"""
+    key = param.partition('=')[0]
+    if '%' in key or '+' in key:
+        key = unquote_plus(key)
+    return key.lower() in _TRACKING_PARAM_KEYS
+
+
 def strip_tracking_params(url: str) -> str:
     """
     Remove tracking parameters from URL.
@@ -172,34 +202,19 @@ def strip_tracking_params(url: str) -> str:
         return ''
     
     try:
-        parsed = urlparse(url)
-        
-        # Parse query string
-        params = parse_qs(parsed.query, keep_blank_values=False)
-        
-        # Remove tracking params (case-insensitive)
-        tracking_lower = {p.lower() for p in TRACKING_PARAMS}
-        clean_params = {
-            k: v for k, v in params.items()
-            if k.lower() not in tracking_lower
-        }
-        
-        # Reconstruct URL
-        clean_query = urlencode(clean_params, doseq=True) if clean_params else ''
-        
-        clean_url = urlunparse((
-            parsed.scheme,
-            parsed.netloc,
-            parsed.path,
-            parsed.params,
-            clean_query,
-            ''  # Remove fragment
-        ))
-        
-        return clean_url
-        
-    except Exception:
+        scheme, netloc, path, query, _ = urlsplit(url)
+    except ValueError:
         return url
+    
+    # Drop tracking params (and empty '&&' pieces) in place, keeping the
+    # remaining parameters in their original order and encoding
+    if query:
+        query = '&'.join(
+            param for param in query.split('&')
+            if param and not _is_tracking_param(param)
+        )
+    
+    return urlunsplit((scheme, netloc, path, query, ''))  # Remove fragment
 
 
 def normalize_url(url: str) -> str:
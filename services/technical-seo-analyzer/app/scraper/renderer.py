@@ -7,11 +7,12 @@ Key features:
 - Wait for actual content (not just containers)
 - Multiple content detection strategies
 - Extended timeouts for AJAX/React
+- Pre-created browser contexts, one fresh context per render
 """
 
 import asyncio
 import logging
-from typing import Optional, Tuple
+from typing import Optional, Set, Tuple
 from playwright.async_api import async_playwright, Browser, Page, BrowserContext
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,19 @@ logger = logging.getLogger(__name__)
 _browser: Optional[Browser] = None
 _playwright = None
 
+# Pool of ready browser contexts. Each render takes one; once it is done the
+# context is closed and replaced in the background, so no cookies, storage or
+# cache leak between renders and no render waits for a context to be created
+CONTEXT_POOL_SIZE = 4
+_context_pool: Optional[asyncio.Queue] = None
+_pool_browser: Optional[Browser] = None
+_pool_lock = asyncio.Lock()
+# Pending _recycle_context tasks (referenced so they are not garbage collected)
+_recycle_tasks: Set[asyncio.Task] = set()
+
+# Resource types not needed for the rendered HTML
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+
 # User agent
 DESKTOP_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -79,9 +93,103 @@ async def _get_browser() -> Browser:
     return _browser
 
 
+async def _new_context(browser: Browser) -> BrowserContext:
+    """Create a browser context with the desktop profile."""
+    return await browser.new_context(
+        user_agent=DESKTOP_USER_AGENT,
+        viewport={'width': 1920, 'height': 1080},
+        java_script_enabled=True,
+        bypass_csp=True,
+    )
+
+
+async def warmup(pool_size: int = CONTEXT_POOL_SIZE) -> None:
+    """Launch the browser and pre-create a pool of browser contexts."""
+    global _context_pool, _pool_browser
+    
+    browser = await _get_browser()
+    pool = asyncio.Queue()
+    for _ in range(pool_size):
+        pool.put_nowait(await _new_context(browser))
+    
+    _context_pool = pool
+    _pool_browser = browser
+    logger.info(f"Playwright warmed up with {pool_size} browser contexts")
+
+
+async def _acquire_context() -> BrowserContext:
+    """Take a fresh context from the pool, or create one if the pool is empty."""
+    async with _pool_lock:
+        browser = await _get_browser()
+        if _context_pool is None or _pool_browser is not browser:
+            await warmup()
+    try:
+        return _context_pool.get_nowait()
+    except asyncio.QueueEmpty:
+        return await _new_context(browser)
+
+
+async def _recycle_context(context: BrowserContext) -> None:
+    """Close a used context and top the pool back up with a fresh one."""
+    try:
+        await context.close()
+    except Exception as e:
+        logger.warning(f"Could not close browser context: {e}")
+    
+    pool, browser = _context_pool, _pool_browser
+    if pool is None or browser is None or not browser.is_connected():
+        return
+    if pool.qsize() >= CONTEXT_POOL_SIZE:
+        return
+    try:
+        fresh = await _new_context(browser)
+    except Exception as e:
+        logger.error(f"Could not replace browser context: {e}")
+        return
+    if pool is _context_pool:
+        pool.put_nowait(fresh)
+    else:
+        # The pool was rebuilt or shut down meanwhile
+        await fresh.close()
+
+
+def _release_context(context: BrowserContext) -> None:
+    """Recycle a used context in the background, off the render's latency path."""
+    task = asyncio.create_task(_recycle_context(context))
+    _recycle_tasks.add(task)
+    task.add_done_callback(_recycle_tasks.discard)
+
+
+def is_ready() -> bool:
+    """Whether the browser is running and the context pool is initialized."""
+    return (
+        _browser is not None and _browser.is_connected()
+        and _context_pool is not None and _pool_browser is _browser
+    )
+
+
+async def _block_heavy_resources(route) -> None:
+    """Abort requests for images, media and fonts."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
 async def _close_browser():
     """Close browser instance."""
-    global _browser, _playwright
+    global _browser, _playwright, _context_pool, _pool_browser
+    # Let in-flight recycling finish closing its contexts first
+    if _recycle_tasks:
+        await asyncio.gather(*_recycle_tasks, return_exceptions=True)
+    if _context_pool is not None:
+        while not _context_pool.empty():
+            try:
+                await _context_pool.get_nowait().close()
+            except Exception:
+                pass
+        _context_pool = None
+        _pool_browser = None
     if _browser:
         await _browser.close()
         _browser = None
@@ -240,21 +348,31 @@ async def _click_cookie_buttons(page: Page) -> None:
 
 
 async def _wait_for_selectors(page: Page, timeout_ms: int = 10000) -> Optional[str]:
-    """Wait for any content selector to appear with content."""
-    for selector in CONTENT_SELECTORS:
-        try:
-            element = page.locator(selector).first
-            await element.wait_for(state='attached', timeout=timeout_ms // len(CONTENT_SELECTORS))
-            
-            # Check if it has content
-            text_length = await element.evaluate('el => (el.innerText || "").length')
-            if text_length > 100:
-                logger.info(f"Found content in: {selector} ({text_length} chars)")
-                return selector
-        except:
-            continue
+    """
+    Wait for any content selector to appear with content.
     
-    return None
+    All selectors are checked together in the page (priority order) on each
+    poll, so the wait ends as soon as one has content instead of giving each
+    selector its own slice of the timeout.
+    """
+    try:
+        handle = await page.wait_for_function('''
+            (selectors) => {
+                for (const selector of selectors) {
+                    const el = document.querySelector(selector);
+                    const length = el ? (el.innerText || "").length : 0;
+                    if (length > 100) {
+                        return [selector, length];
+                    }
+                }
+                return null;
+            }
+        ''', arg=CONTENT_SELECTORS, timeout=timeout_ms, polling=100)
+        selector, text_length = await handle.json_value()
+        logger.info(f"Found content in: {selector} ({text_length} chars)")
+        return selector
+    except Exception:
+        return None
 
 
 async def get_rendered_html_async(
@@ -262,7 +380,8 @@ async def get_rendered_html_async(
     timeout_ms: int = 60000,
     min_words: int = 150,
     scroll_wait_ms: int = 2000,
-    content_wait_ms: int = 15000
+    content_wait_ms: int = 15000,
+    block_resources: bool = False
 ) -> str:
     """
     Fetch and render URL with full content extraction.
@@ -281,24 +400,22 @@ async def get_rendered_html_async(
         min_words: Minimum words to wait for
         scroll_wait_ms: Wait time after scrolling
         content_wait_ms: Max wait for content to appear
+        block_resources: Skip downloading images, media and fonts (opt-in: lazy
+            content and layout can depend on them)
         
     Returns:
         Fully rendered HTML
     """
-    browser = await _get_browser()
     context: Optional[BrowserContext] = None
     page: Optional[Page] = None
     
     try:
-        # Create context
-        context = await browser.new_context(
-            user_agent=DESKTOP_USER_AGENT,
-            viewport={'width': 1920, 'height': 1080},
-            java_script_enabled=True,
-            bypass_csp=True,
-        )
+        # Take a fresh pre-created context
+        context = await _acquire_context()
         
         page = await context.new_page()
+        if block_resources:
+            await page.route('**/*', _block_heavy_resources)
         
         logger.info(f"Rendering: {url}")
         
@@ -357,10 +474,14 @@ async def get_rendered_html_async(
         raise
         
     finally:
-        if page:
-            await page.close()
-        if context:
-            await context.close()
+        try:
+            if page:
+                await page.close()
+        except Exception as e:
+            logger.warning(f"Could not close page: {e}")
+        finally:
+            if context:
+                _release_context(context)
 
 
 def get_rendered_html(
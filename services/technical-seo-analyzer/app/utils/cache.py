@@ -0,0 +1,104 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+class LRUCache:
+    """Small thread-safe least-recently-used cache"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key (marking it recently used), or None"""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store value under key, evicting the least recently used entry when full"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class TTLCache(LRUCache):
+    """LRU cache whose entries expire ttl seconds after being stored"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        super().__init__(maxsize)
+        self.ttl = ttl
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        entry = super().get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            with self._lock:
+                self._discard(key)
+            return None
+        return value
+
+    def _discard(self, key: Hashable):
+        """Drop key if present (caller holds the lock)"""
+        self._data.pop(key, None)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store value under key for ttl seconds (defaults to the cache ttl)"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        super().set(key, (expires_at, value))
+
+class SizedTTLCache(TTLCache):
+    """
+    TTL cache that is also bounded by the total size of its values
+
+    Values larger than maxbytes on their own are not stored. Sizes come from
+    sizeof (len by default, i.e. characters for cached strings).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0, maxbytes: int = 64 * 1024 * 1024,
+                 sizeof: Callable[[Any], int] = len):
+        super().__init__(maxsize, ttl)
+        self.maxbytes = maxbytes
+        self._sizeof = sizeof
+        self._bytes = 0
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store value under key, evicting least recently used entries until both bounds hold"""
+        size = self._sizeof(value)
+        if size > self.maxbytes:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._discard(key)
+            self._data[key] = (expires_at, value)
+            self._bytes += size
+            while len(self._data) > self.maxsize or self._bytes > self.maxbytes:
+                _, (_, evicted) = self._data.popitem(last=False)
+                self._bytes -= self._sizeof(evicted)
+
+    def _discard(self, key: Hashable):
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= self._sizeof(entry[1])
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
@@ -1,16 +1,66 @@
+import asyncio
 import httpx
 from bs4 import BeautifulSoup
+from typing import Awaitable, Callable, Dict, Optional, Tuple
 from app.config import settings
+from app.utils.cache import SizedTTLCache
 import logging
 
 logger = logging.getLogger(__name__)
 
-async def fetch_html(url: str) -> str:
+# Fetched/rendered HTML is reused for a few minutes, keyed on the normalized URL;
+# bounded by total size as well (rendered HTML has no per-page size limit)
+HTML_CACHE_TTL = 300
+HTML_CACHE_MAX_CHARS = 64 * 1024 * 1024
+_html_cache = SizedTTLCache(maxsize=256, ttl=HTML_CACHE_TTL, maxbytes=HTML_CACHE_MAX_CHARS)
+_pending_fetches: Dict[tuple, asyncio.Future] = {}
+
+# Connection pool limits for shared HTTP clients
+MAX_KEEPALIVE_CONNECTIONS = 100
+MAX_CONNECTIONS = 200
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create a connection-pooled HTTP client for fetch_html
+    
+    Share one client across requests so keep-alive connections (and their
+    TCP/TLS handshakes) are reused. The caller is responsible for closing it.
+    
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    return httpx.AsyncClient(
+        timeout=settings.REQUEST_TIMEOUT,
+        follow_redirects=True,
+        headers={
+            'User-Agent': 'Mozilla/5.0 (compatible; SEO-Expert-Bot/1.0)'
+        },
+        limits=httpx.Limits(
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            max_connections=MAX_CONNECTIONS
+        )
+    )
+
+async def _get_html(client: httpx.AsyncClient, url: str) -> str:
+    """GET a URL and return its text, enforcing the content size limit"""
+    response = await client.get(url)
+    response.raise_for_status()
+    
+    # Check content length
+    content_length = len(response.content)
+    if content_length > settings.MAX_CONTENT_LENGTH:
+        raise Exception(f"Content too large: {content_length} bytes")
+    
+    return response.text
+
+async def fetch_html(url: str, client: Optional[httpx.AsyncClient] = None) -> str:
     """
     Fetch HTML content from a URL
     
     Args:
         url: The URL to fetch
+        client: Shared client from create_http_client (a one-off client
+                is created and closed when omitted)
         
     Returns:
         HTML content as string
@@ -19,33 +69,61 @@ async def fetch_html(url: str) -> str:
         Exception: If fetching fails
     """
     try:
-        async with httpx.AsyncClient(
-            timeout=settings.REQUEST_TIMEOUT,
-            follow_redirects=True,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; SEO-Expert-Bot/1.0)'
-            }
-        ) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            
-            # Check content length
-            content_length = len(response.content)
-            if content_length > settings.MAX_CONTENT_LENGTH:
-                raise Exception(f"Content too large: {content_length} bytes")
-            
-            return response.text
+        if client is None:
+            async with create_http_client() as client:
+                return await _get_html(client, url)
+        return await _get_html(client, url)
             
     except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error fetching {url}: {e}")
+        logger.error("HTTP error fetching %s: %s", url, e)
         raise Exception(f"Failed to fetch URL (HTTP {e.response.status_code})")
     except httpx.TimeoutException:
-        logger.error(f"Timeout fetching {url}")
+        logger.error("Timeout fetching %s", url)
         raise Exception("Request timeout")
     except Exception as e:
-        logger.error(f"Error fetching {url}: {str(e)}")
+        logger.error("Error fetching %s: %s", url, e)
         raise Exception(f"Failed to fetch URL: {str(e)}")
 
+async def cached_fetch(url: str, fetch: Callable[[], Awaitable[str]], kind: str = 'http',
+                       options: Tuple = ()) -> str:
+    """
+    Return recently fetched HTML for a URL, fetching it on a miss
+    
+    The cache key is the normalized URL (tracking params stripped) plus the
+    fetch kind and options, so utm_* variants share one entry while plain
+    HTTP and rendered HTML (and renders with different settings) are kept
+    apart. Concurrent misses for the same key share a single fetch.
+    
+    Args:
+        url: The URL being fetched
+        fetch: Zero-argument coroutine function performing the actual fetch
+        kind: Fetch method, e.g. 'http' or 'playwright'
+        options: Hashable fetch settings that change the result (e.g. render timeouts)
+        
+    Returns:
+        HTML content as string
+    """
+    # Lazy import: the scraper package pulls in Playwright
+    from app.scraper.helpers import normalize_url
+    
+    key = (kind, normalize_url(url), options)
+    
+    html_content = _html_cache.get(key)
+    if html_content is not None:
+        logger.info("HTML cache hit for %s (%s)", url, kind)
+        return html_content
+    
+    pending = _pending_fetches.get(key)
+    if pending is None:
+        pending = asyncio.ensure_future(fetch())
+        _pending_fetches[key] = pending
+        pending.add_done_callback(lambda _: _pending_fetches.pop(key, None))
+    
+    # Shield so one cancelled request does not abort the fetch for the others
+    html_content = await asyncio.shield(pending)
+    _html_cache.set(key, html_content)
+    return html_content
+
 def parse_html(html_content: str) -> BeautifulSoup:
     """
     Parse HTML content with BeautifulSoup
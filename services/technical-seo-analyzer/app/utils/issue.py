@@ -0,0 +1,46 @@
+from dataclasses import dataclass, asdict, field
+from typing import Optional, Tuple
+
+# Sort rank for each impact level (most severe first)
+IMPACT_RANKS = {'high': 0, 'medium': 1, 'low': 2}
+
+@dataclass(slots=True, frozen=True)
+class Issue:
+    """A single SEO issue reported by an analyzer"""
+
+    type: str
+    category: str
+    message: str
+    recommendation: str
+    impact: str = 'low'
+    examples: Optional[Tuple[str, ...]] = None
+    # Occurrences folded into this issue; each one is penalized when scoring
+    count: int = 1
+    impact_rank: int = field(init=False)
+
+    def __post_init__(self):
+        # Frozen dataclass: derived field has to bypass __setattr__
+        object.__setattr__(self, 'impact_rank', IMPACT_RANKS.get(self.impact, 2))
+
+    def to_dict(self) -> dict:
+        """Serialize for JSON responses (examples and count only when aggregated)"""
+        data = asdict(self)
+        if self.examples is None:
+            del data['examples']
+        else:
+            data['examples'] = list(self.examples)
+        if self.count == 1:
+            del data['count']
+        return data
+
+def serialize_issues(issues: list) -> list:
+    """
+    Convert Issue objects to plain dictionaries
+
+    Args:
+        issues: List of Issue objects
+
+    Returns:
+        List of issue dictionaries
+    """
+    return [issue.to_dict() for issue in issues]
@@ -0,0 +1,22 @@
+import logging
+from pythonjsonlogger import jsonlogger
+
+# Record attributes emitted by the JSON formatter, renamed for log aggregation;
+# exc_info, stack_info and any `extra=` fields are added by the formatter
+JSON_LOG_FORMAT = '%(asctime)s %(levelname)s %(name)s %(message)s'
+JSON_LOG_FIELDS = {'asctime': 'time', 'levelname': 'level', 'name': 'logger'}
+
+def configure_logging(level: str = 'INFO', log_format: str = 'text'):
+    """
+    Configure root logging
+
+    Args:
+        level: Logging level name
+        log_format: 'json' for JSON lines, anything else for plain text
+    """
+    if log_format == 'json':
+        handler = logging.StreamHandler()
+        handler.setFormatter(jsonlogger.JsonFormatter(JSON_LOG_FORMAT, rename_fields=JSON_LOG_FIELDS))
+        logging.basicConfig(level=level, handlers=[handler])
+    else:
+        logging.basicConfig(level=level)
@@ -30,13 +30,13 @@ def calculate_overall_score(results: dict) -> dict:
             
             # Deduct points for issues
             for issue in issues:
-                impact = issue.get('impact', 'low')
+                impact = issue.impact
                 penalty = {
                     'high': 25,
                     'medium': 10,
                     'low': 5
                 }.get(impact, 5)
-                base_score -= penalty
+                base_score -= penalty * issue.count
             
             scores[category] = max(0, base_score)
         else:
@@ -55,7 +55,7 @@ def calculate_score_from_issues(issues: list, max_score: int = 100) -> int:
     Calculate score based on number and severity of issues
     
     Args:
-        issues: List of issue dictionaries
+        issues: List of Issue objects
         max_score: Maximum possible score
         
     Returns:
@@ -64,12 +64,12 @@ def calculate_score_from_issues(issues: list, max_score: int = 100) -> int:
     score = max_score
     
     for issue in issues:
-        impact = issue.get('impact', 'low')
+        impact = issue.impact
         penalty = {
             'high': 25,
             'medium': 10,
             'low': 5
         }.get(impact, 5)
-        score -= penalty
+        score -= penalty * issue.count
     
     return max(0, min(score, max_score))
@@ -0,0 +1,49 @@
+"""Tests for the /analyze payload built by app.main"""
+import pytest
+
+from app.main import build_analysis
+
+PAGE = (
+    '<html><head><title>Post</title></head><body><article>'
+    '<h1>Main heading</h1>'
+    '<p>' + 'Some readable words in a sentence. ' * 40 + '</p>'
+    '<ul><li>First list item</li><li>Second list item</li></ul>'
+    '<blockquote>A quoted line of text here.</blockquote>'
+    '</article></body></html>'
+)
+
+
+def _has_html_key(value) -> bool:
+    if isinstance(value, dict):
+        return 'html' in value or any(_has_html_key(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_has_html_key(item) for item in value)
+    return False
+
+
+@pytest.mark.asyncio
+async def test_content_quality_extracted_is_text_only_copy():
+    payload = await build_analysis('https://example.com/post', True, PAGE)
+    extracted_content = payload['extracted_content']
+    extracted = payload['content_quality']['extracted']
+    
+    # The full extraction keeps all markup
+    assert extracted_content['html'].startswith('<article>')
+    assert all('html' in elem for elem in extracted_content['elements_in_order'])
+    
+    # The content-analysis copy has the same elements without any 'html' field
+    assert not _has_html_key(extracted)
+    assert extracted['elements_in_order'] == [
+        {k: v for k, v in elem.items() if k != 'html'}
+        for elem in extracted_content['elements_in_order']
+    ]
+    assert [h['text'] for h in extracted['headings']] == ['Main heading']
+    assert extracted['full_text'] == extracted_content['full_text']
+
+
+@pytest.mark.asyncio
+async def test_plain_http_analysis_has_no_extraction():
+    payload = await build_analysis('https://example.com/post', False, PAGE)
+    
+    assert payload['extracted_content'] is None
+    assert 'extracted' not in payload['content_quality']
@@ -0,0 +1,102 @@
+"""Tests for app.batch"""
+import asyncio
+
+import pytest
+
+from app import batch
+from app.batch import analyze_many
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(batch, 'RETRY_BACKOFF', 0)
+
+
+async def analyze(url: str, html: str) -> dict:
+    return {'url': url, 'html': html}
+
+
+@pytest.mark.asyncio
+async def test_duplicate_urls_are_analyzed_once():
+    fetched = []
+    
+    async def fetch(url: str) -> str:
+        fetched.append(url)
+        return f'<p>{url}</p>'
+    
+    results = await analyze_many(['https://a.test/', 'https://b.test/', 'https://a.test/'], fetch, analyze)
+    
+    assert fetched.count('https://a.test/') == 1
+    assert list(results) == ['https://a.test/', 'https://b.test/']
+    assert results['https://b.test/'] == {'url': 'https://b.test/', 'html': '<p>https://b.test/</p>'}
+
+
+@pytest.mark.asyncio
+async def test_failed_fetches_are_retried():
+    attempts = {'count': 0}
+    
+    async def flaky_fetch(url: str) -> str:
+        attempts['count'] += 1
+        if attempts['count'] < 3:
+            raise RuntimeError('connection reset')
+        return '<p>ok</p>'
+    
+    results = await analyze_many(['https://a.test/'], flaky_fetch, analyze, retries=2)
+    
+    assert attempts['count'] == 3
+    assert results['https://a.test/']['html'] == '<p>ok</p>'
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_report_the_error():
+    attempts = {'count': 0}
+    
+    async def failing_fetch(url: str) -> str:
+        attempts['count'] += 1
+        raise RuntimeError('Failed to fetch URL (HTTP 404)')
+    
+    async def ok_fetch(url: str) -> str:
+        if url == 'https://bad.test/':
+            return await failing_fetch(url)
+        return '<p>ok</p>'
+    
+    results = await analyze_many(['https://bad.test/', 'https://good.test/'], ok_fetch, analyze, retries=1)
+    
+    assert attempts['count'] == 2
+    assert results['https://bad.test/'] == {'error': 'Failed to fetch URL (HTTP 404)'}
+    assert results['https://good.test/']['html'] == '<p>ok</p>'
+
+
+@pytest.mark.asyncio
+async def test_analysis_errors_are_not_retried():
+    fetched = []
+    
+    async def fetch(url: str) -> str:
+        fetched.append(url)
+        return '<p>ok</p>'
+    
+    async def broken_analyze(url: str, html: str) -> dict:
+        raise ValueError('analysis failed')
+    
+    results = await analyze_many(['https://a.test/'], fetch, broken_analyze, retries=2)
+    
+    assert fetched == ['https://a.test/']
+    assert results == {'https://a.test/': {'error': 'analysis failed'}}
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    active = {'now': 0, 'peak': 0}
+    
+    async def fetch(url: str) -> str:
+        active['now'] += 1
+        active['peak'] = max(active['peak'], active['now'])
+        await asyncio.sleep(0.01)
+        active['now'] -= 1
+        return ''
+    
+    urls = [f'https://example.test/{i}' for i in range(10)]
+    results = await analyze_many(urls, fetch, analyze, concurrency=3)
+    
+    assert len(results) == 10
+    assert active['peak'] == 3
@@ -0,0 +1,100 @@
+"""Tests for app.utils.cache"""
+import pytest
+
+from app.utils import cache as cache_module
+from app.utils.cache import LRUCache, SizedTTLCache, TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module.time, 'monotonic', fake)
+    return fake
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1  # 'b' is now least recently used
+    cache.set('c', 3)
+    
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+    assert len(cache) == 2
+
+
+def test_ttl_cache_expires_entries(clock):
+    cache = TTLCache(maxsize=8, ttl=60)
+    cache.set('a', 'value')
+    
+    clock.now += 59
+    assert cache.get('a') == 'value'
+    clock.now += 2
+    assert cache.get('a') is None
+    assert len(cache) == 0  # expired entries are dropped on access
+
+
+def test_ttl_cache_per_entry_ttl(clock):
+    cache = TTLCache(maxsize=8, ttl=60)
+    cache.set('short', 1, ttl=5)
+    cache.set('default', 2)
+    
+    clock.now += 10
+    assert cache.get('short') is None
+    assert cache.get('default') == 2
+
+
+def test_sized_ttl_cache_evicts_by_total_size(clock):
+    cache = SizedTTLCache(maxsize=10, ttl=60, maxbytes=10)
+    cache.set('a', 'xxxx')
+    cache.set('b', 'yyyy')
+    cache.set('c', 'zzz')  # 11 characters: 'a' has to go
+    
+    assert cache.get('a') is None
+    assert (cache.get('b'), cache.get('c')) == ('yyyy', 'zzz')
+    assert cache._bytes == 7
+
+
+def test_sized_ttl_cache_skips_values_over_the_cap(clock):
+    cache = SizedTTLCache(maxsize=10, ttl=60, maxbytes=10)
+    cache.set('small', 'abc')
+    cache.set('huge', 'x' * 11)
+    
+    assert cache.get('huge') is None
+    assert cache.get('small') == 'abc'
+    assert cache._bytes == 3
+
+
+def test_sized_ttl_cache_tracks_size_on_replace_expiry_and_clear(clock):
+    cache = SizedTTLCache(maxsize=10, ttl=60, maxbytes=100)
+    cache.set('a', 'x' * 40)
+    cache.set('a', 'x' * 10)
+    assert cache._bytes == 10
+    
+    cache.set('b', 'y' * 5, ttl=1)
+    clock.now += 2
+    assert cache.get('b') is None
+    assert cache._bytes == 10
+    
+    cache.clear()
+    assert len(cache) == 0
+    assert cache._bytes == 0
+
+
+def test_sized_ttl_cache_respects_maxsize(clock):
+    cache = SizedTTLCache(maxsize=2, ttl=60, maxbytes=100)
+    for key in 'abc':
+        cache.set(key, key)
+    
+    assert cache.get('a') is None
+    assert len(cache) == 2
+    assert cache._bytes == 2
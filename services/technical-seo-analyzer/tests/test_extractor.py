@@ -0,0 +1,46 @@
+"""Tests for app.scraper.extractor"""
+from app.scraper.extractor import extract_content
+
+
+def test_extract_content_skips_content_match_inside_noscript():
+    html = (
+        '<html><body>'
+        '<noscript><div class="content"><p>Please enable JavaScript to view this page.</p></div></noscript>'
+        '<div class="post"><h2>Post title</h2><p>The real post paragraph with enough words in it.</p></div>'
+        '</body></html>'
+    )
+    result = extract_content(html)
+    
+    assert result['html'].startswith('<div class="post">')
+    assert [h['text'] for h in result['headings']] == ['Post title']
+    assert [p['text'] for p in result['paragraphs']] == ['The real post paragraph with enough words in it.']
+    assert 'enable JavaScript' not in ' '.join(e['text'] for e in result['elements_in_order'])
+
+
+def test_extract_tables_skips_only_the_first_row_without_thead():
+    # Long tables often repeat the header row; only the first one is the header
+    html = (
+        '<html><body><article><table>'
+        '<tr><th>Name</th><th>Price</th></tr>'
+        '<tr><td>Apple</td><td>1</td></tr>'
+        '<tr><th>Name</th><th>Price</th></tr>'
+        '<tr><td>Pear</td><td>2</td></tr>'
+        '</table></article></body></html>'
+    )
+    [table] = extract_content(html)['tables']
+    
+    assert table['headers'] == []
+    assert table['rows'] == [['Apple', '1'], ['Name', 'Price'], ['Pear', '2']]
+
+
+def test_extract_tables_with_thead_keeps_every_body_row():
+    html = (
+        '<html><body><article><table>'
+        '<thead><tr><th>Name</th><th>Price</th></tr></thead>'
+        '<tbody><tr><td>Apple</td><td>1</td></tr><tr><td>Pear</td><td>2</td></tr></tbody>'
+        '</table></article></body></html>'
+    )
+    [table] = extract_content(html)['tables']
+    
+    assert table['headers'] == ['Name', 'Price']
+    assert table['rows'] == [['Apple', '1'], ['Pear', '2']]
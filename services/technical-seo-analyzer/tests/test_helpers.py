@@ -0,0 +1,56 @@
+"""Tests for app.scraper.helpers URL utilities"""
+import pytest
+
+from app.scraper.helpers import normalize_url, strip_tracking_params
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('https://example.com/page?utm_source=x', 'https://example.com/page'),
+    ('https://example.com/page?id=1&utm_source=x', 'https://example.com/page?id=1'),
+    ('https://example.com/page?utm_source=x&id=1', 'https://example.com/page?id=1'),
+    ('https://example.com/page?a=1&utm_medium=x&b=2', 'https://example.com/page?a=1&b=2'),
+    ('https://example.com/page?UTM_Source=x&id=1', 'https://example.com/page?id=1'),
+    ('https://example.com/page?fbclid&id=1', 'https://example.com/page?id=1'),
+])
+def test_strip_tracking_params_removes_tracking_keys(url, expected):
+    assert strip_tracking_params(url) == expected
+
+
+@pytest.mark.parametrize('url, expected', [
+    # Separators left behind at either end or in the middle are dropped
+    ('https://example.com/?id=1&utm_source=x&', 'https://example.com/?id=1'),
+    ('https://example.com/?&utm_source=x&id=1', 'https://example.com/?id=1'),
+    ('https://example.com/?a=1&&b=2', 'https://example.com/?a=1&b=2'),
+    ('https://example.com/?a=1&utm_source=x&&utm_medium=y&b=2', 'https://example.com/?a=1&b=2'),
+    ('https://example.com/?&&', 'https://example.com/'),
+])
+def test_strip_tracking_params_collapses_separators(url, expected):
+    assert strip_tracking_params(url) == expected
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('https://example.com/?utm%5Fsource=x&id=1', 'https://example.com/?id=1'),
+    ('https://example.com/?id=1&%75tm_campaign=x', 'https://example.com/?id=1'),
+    ('https://example.com/?gcl%69d=abc', 'https://example.com/'),
+])
+def test_strip_tracking_params_decodes_keys(url, expected):
+    assert strip_tracking_params(url) == expected
+
+
+def test_strip_tracking_params_keeps_other_params_verbatim():
+    url = 'https://example.com/search?q=a%20b&tag=&q=c+d#results'
+    assert strip_tracking_params(url) == 'https://example.com/search?q=a%20b&tag=&q=c+d'
+
+
+def test_strip_tracking_params_keeps_lookalike_keys():
+    url = 'https://example.com/?utm_sourcex=1&my_utm_source=2'
+    assert strip_tracking_params(url) == url
+
+
+def test_strip_tracking_params_empty():
+    assert strip_tracking_params('') == ''
+
+
+def test_normalize_url_shares_key_across_tracking_variants():
+    assert normalize_url('https://Example.com/page?utm%5Fsource=a&id=1') == \
+        normalize_url('https://example.com/page?id=1&&utm_source=b')
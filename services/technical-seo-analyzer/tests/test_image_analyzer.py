@@ -0,0 +1,54 @@
+"""Tests for app.analyzers.images"""
+import pytest
+from bs4 import BeautifulSoup
+
+from app.analyzers._constants import MAX_MISSING_ALT_EXAMPLES
+from app.analyzers.images import ImageAnalyzer
+from app.utils.scorer import calculate_overall_score
+
+
+def analyze(html: str) -> dict:
+    return ImageAnalyzer(BeautifulSoup(html, 'lxml')).analyze()
+
+
+@pytest.mark.parametrize('missing, expected_score', [
+    (0, 100),
+    (1, 90),
+    (3, 70),
+    (10, 0),
+    (200, 0),
+])
+def test_missing_alt_penalty_scales_with_count(missing, expected_score):
+    # One medium (-10) penalty per image without alt, as before aggregation
+    result = analyze('<img src="ok.png" alt="ok">' + '<img src="a.png">' * missing)
+    
+    assert result['score'] == expected_score
+    assert calculate_overall_score({'images': result})['images'] == expected_score
+
+
+def test_missing_alt_is_one_aggregated_issue():
+    srcs = [f'/img/{i}.png' for i in range(8)]
+    result = analyze(''.join(f'<img src="{src}">' for src in srcs))
+    
+    assert result['images_without_alt'] == 8
+    assert len(result['issues']) == 1
+    issue = result['issues'][0].to_dict()
+    assert issue['message'] == '8 images missing alt text'
+    assert issue['count'] == 8
+    assert issue['examples'] == srcs[:MAX_MISSING_ALT_EXAMPLES]
+
+
+def test_single_missing_alt_issue_has_no_count():
+    issue = analyze('<img src="a.png">')['issues'][0].to_dict()
+    
+    assert issue['message'] == '1 image missing alt text'
+    assert 'count' not in issue
+
+
+def test_empty_alt_is_not_missing():
+    result = analyze('<img src="a.png" alt="">')
+    
+    assert result['empty_alt'] == 1
+    assert result['images_without_alt'] == 0
+    assert result['issues'] == []
+    assert result['score'] == 100
@@ -0,0 +1,132 @@
+"""Tests for the HTTP helpers and endpoints in app.main"""
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.main import cache_headers, etag_matches, generate_recommendations, stream_extract_payload
+
+ETAG = 'W/"abc123-v3"'
+PAGE = '<html><head><title>Title</title></head><body><p>Hello world</p></body></html>'
+
+
+@pytest.mark.parametrize('if_none_match, expected', [
+    (None, False),
+    ('', False),
+    ('W/"abc123-v3"', True),
+    ('"abc123-v3"', True),  # weak comparison ignores W/
+    ('"other", W/"abc123-v3"', True),
+    ('"other" ,"abc123-v3"', True),
+    ('*', True),
+    ('"other", *', True),
+    ('"abc123-v2"', False),
+    ('"other"', False),
+])
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, ETAG) is expected
+
+
+def test_cache_headers():
+    assert cache_headers(ETAG) == {'ETag': ETAG, 'Cache-Control': main.ANALYZE_CACHE_CONTROL}
+
+
+def test_stream_extract_payload_sends_large_text_last():
+    payload = {
+        'url': 'https://example.com/',
+        'full_text': 'All the words',
+        'headings': [{'text': 'H1'}, {'text': 'H2'}],
+        'paragraphs': [],
+        'html': '<main>markup</main>',
+        'statistics': {'word_count': 3},
+    }
+    lines = [orjson.loads(line) for line in stream_extract_payload(payload)]
+    
+    assert lines == [
+        {'url': 'https://example.com/', 'statistics': {'word_count': 3}},
+        {'section': 'headings', 'item': {'text': 'H1'}},
+        {'section': 'headings', 'item': {'text': 'H2'}},
+        {'field': 'full_text', 'value': 'All the words'},
+        {'field': 'html', 'value': '<main>markup</main>'},
+    ]
+
+
+def test_stream_extract_payload_lines_are_newline_terminated():
+    chunks = list(stream_extract_payload({'url': 'u', 'html': 'a\nb'}))
+    
+    assert all(chunk.endswith(b'\n') and chunk.count(b'\n') == 1 for chunk in chunks)
+
+
+def test_content_recommendation_follows_content_score():
+    recommendation = 'Improve content quality and readability'
+    good = {'meta': 100, 'headings': 100, 'images': 100, 'schema': 100}
+    
+    assert recommendation not in generate_recommendations([], {**good, 'content': 90})
+    assert recommendation in generate_recommendations([], {**good, 'content': 50})
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fetches = []
+    
+    async def fake_fetch_page(url_str, use_playwright, timeout_ms=None, min_words=None, scroll_wait_ms=None):
+        fetches.append((url_str, use_playwright, timeout_ms))
+        return PAGE
+    
+    monkeypatch.setattr(main, 'fetch_page', fake_fetch_page)
+    main._analyze_response_cache.clear()
+    # Not entered as a context manager: startup would launch Playwright
+    test_client = TestClient(main.app)
+    test_client.fetches = fetches
+    yield test_client
+    main._analyze_response_cache.clear()
+
+
+def analyze(client, headers=None, **body):
+    return client.post('/analyze', json={'url': 'https://example.com/', 'use_playwright': False, **body},
+                       headers=headers or {})
+
+
+def test_analyze_sends_etag_and_cache_control(client):
+    response = analyze(client)
+    
+    assert response.status_code == 200
+    assert response.headers['etag'].startswith('W/"')
+    assert response.headers['cache-control'] == main.ANALYZE_CACHE_CONTROL
+
+
+def test_analyze_cache_hit_returns_same_payload(client):
+    first = analyze(client)
+    second = analyze(client)
+    
+    assert len(client.fetches) == 1
+    assert second.json() == first.json()
+    assert second.headers['etag'] == first.headers['etag']
+
+
+def test_analyze_cache_key_includes_render_options(client):
+    analyze(client)
+    analyze(client, timeout_ms=5000)
+    
+    assert [fetch[2] for fetch in client.fetches] == [60000, 5000]
+
+
+@pytest.mark.parametrize('cached', [False, True])
+def test_analyze_not_modified(client, cached):
+    etag = analyze(client).headers['etag']
+    if not cached:
+        main._analyze_response_cache.clear()
+    
+    response = analyze(client, headers={'If-None-Match': f'"stale", {etag.removeprefix("W/")}'})
+    
+    assert response.status_code == 304
+    assert response.content == b''
+    assert response.headers['etag'] == etag
+    assert response.headers['cache-control'] == main.ANALYZE_CACHE_CONTROL
+
+
+def test_analyze_stale_etag_gets_full_response(client):
+    analyze(client)
+    response = analyze(client, headers={'If-None-Match': 'W/"stale-v1"'})
+    
+    assert response.status_code == 200
+    assert response.json()['url'] == 'https://example.com/'
@@ -0,0 +1,99 @@
+"""Tests for the cached analysis pipeline in app.pipeline"""
+import pytest
+
+from app import pipeline
+from app.pipeline import ANALYZERS, analyze_page, analyze_page_async, extract_page, run_analyzers
+from app.utils.fetcher import parse_html
+
+URL = 'https://example.com/post'
+PAGE = (
+    '<html><head><title>Cached page title</title></head><body><article>'
+    '<h1>Heading</h1><p>' + 'Plain words in a readable sentence. ' * 20 + '</p>'
+    '<img src="/a.png"></article></body></html>'
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    pipeline._analysis_cache.clear()
+    yield
+    pipeline._analysis_cache.clear()
+
+
+@pytest.fixture
+def count_runs(monkeypatch):
+    calls = []
+    
+    def counting(name, analyzer):
+        def run(url, soup):
+            calls.append(name)
+            return analyzer(url, soup)
+        return run
+    
+    monkeypatch.setattr(pipeline, 'ANALYZERS', {name: counting(name, fn) for name, fn in ANALYZERS.items()})
+    return calls
+
+
+def test_analyze_page_matches_uncached_run():
+    assert analyze_page(URL, PAGE) == run_analyzers(URL, parse_html(PAGE))
+
+
+def test_identical_html_is_analyzed_once(count_runs):
+    first = analyze_page(URL, PAGE)
+    second = analyze_page(URL, PAGE)
+    
+    assert sorted(count_runs) == sorted(ANALYZERS)
+    assert second == first
+
+
+def test_url_dependent_analyzers_rerun_for_another_url(count_runs):
+    analyze_page(URL, PAGE)
+    count_runs.clear()
+    analyze_page('https://mirror.example.com/post', PAGE)
+    
+    assert sorted(count_runs) == sorted(pipeline.URL_DEPENDENT_ANALYZERS)
+
+
+def test_results_are_copies_of_the_cached_dicts():
+    first = analyze_page(URL, PAGE)
+    first['images']['issues'] = []
+    first['meta']['score'] = -1
+    
+    second = analyze_page(URL, PAGE)
+    assert len(second['images']['issues']) == 1
+    assert second['meta']['score'] != -1
+
+
+@pytest.mark.asyncio
+async def test_async_variant_shares_the_cache(count_runs):
+    expected = analyze_page(URL, PAGE)
+    count_runs.clear()
+    
+    assert await analyze_page_async(URL, PAGE) == expected
+    assert count_runs == []
+
+
+@pytest.mark.asyncio
+async def test_async_variant_runs_only_requested_analyzers(count_runs):
+    results = await analyze_page_async(URL, PAGE, names=['meta', 'headings'])
+    
+    assert sorted(results) == ['headings', 'meta']
+    assert sorted(count_runs) == ['headings', 'meta']
+
+
+def test_extract_page_caches_per_markup_option(monkeypatch):
+    calls = []
+    real_extract = pipeline.extract_content
+    
+    def counting_extract(html, include_html=True):
+        calls.append(include_html)
+        return real_extract(html, include_html)
+    
+    monkeypatch.setattr(pipeline, 'extract_content', counting_extract)
+    with_html = extract_page(PAGE)
+    assert extract_page(PAGE) == with_html
+    without_html = extract_page(PAGE, include_html=False)
+    
+    assert calls == [True, False]
+    assert 'html' in with_html and 'html' not in without_html
+    assert without_html['full_text'] == with_html['full_text']
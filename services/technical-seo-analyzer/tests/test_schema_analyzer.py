@@ -0,0 +1,32 @@
+"""Tests for app.analyzers.schema"""
+import math
+
+from bs4 import BeautifulSoup
+
+from app.analyzers.schema import SchemaAnalyzer
+
+
+def analyze(*blocks: str) -> dict:
+    html = ''.join(f'<script type="application/ld+json">{block}</script>' for block in blocks)
+    return SchemaAnalyzer(BeautifulSoup(html, 'lxml')).analyze()
+
+
+def test_nan_literal_falls_back_to_json():
+    result = analyze('{"@type": "Product", "price": NaN}')
+    
+    assert [schema['type'] for schema in result['schemas']] == ['Product']
+    assert math.isnan(result['schemas'][0]['data']['price'])
+    assert not any(issue.message == 'Invalid JSON-LD syntax' for issue in result['issues'])
+
+
+def test_invalid_json_ld_is_reported():
+    result = analyze('{"@type": "Product",', '{"@type": "Organization"}')
+    
+    assert [schema['type'] for schema in result['schemas']] == ['Organization']
+    assert sum(issue.message == 'Invalid JSON-LD syntax' for issue in result['issues']) == 1
+
+
+def test_graph_items_are_flattened_in_order():
+    result = analyze('{"@graph": [{"@type": "WebSite"}, [{"@type": "Article"}, {"name": "no type"}]]}')
+    
+    assert [schema['type'] for schema in result['schemas']] == ['WebSite', 'Article']